@@ -0,0 +1,157 @@
+import contextlib
+import os
+import time
+
+import click
+import pandas as pd
+import uvicorn
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route
+
+from preprocessing_server import (
+    metric_values, metrics, model_reloader, payload_errors, predict_processed, prediction_cache,
+    preprocess_data, readiness, reload_model_now, start_background_tasks,
+)
+from src.binary_payloads import BINARY_CONTENT_TYPES, PayloadError, decode_frame, encode_predictions
+from src.micro_batching import MicroBatcher
+from src.serving_metrics import ServingMetrics
+
+# Batching knobs; also settable from the command line.
+MAX_BATCH_SIZE = int(os.environ.get("MAX_BATCH_SIZE", "256"))
+MAX_WAIT_MS = float(os.environ.get("MAX_WAIT_MS", "5"))
+
+
+def predict_batch(df:pd.DataFrame):
+    return predict_processed(df)
+
+
+batcher = MicroBatcher(predict_batch, max_batch_size=MAX_BATCH_SIZE, max_wait_ms=MAX_WAIT_MS)
+
+
+async def health(request):
+    return JSONResponse({"status": "healthy"})
+
+
+async def ready(request):
+    """Ready only once the startup warm-up has run; 503 until then."""
+    return JSONResponse(readiness, status_code=200 if readiness["status"] == "ready" else 503)
+
+
+async def cache_metrics(request):
+    return JSONResponse(prediction_cache.metrics())
+
+
+async def prometheus_metrics(request):
+    return Response(metrics.render(**metric_values()), media_type=ServingMetrics.CONTENT_TYPE)
+
+
+async def model_status(request):
+    return JSONResponse(model_reloader.status())
+
+
+async def reload_model(request):
+    # Loading and warming up a model blocks, so keep it off the event loop
+    body, status = await run_in_threadpool(reload_model_now)
+    return JSONResponse(body, status_code=status)
+
+
+def schema_error_response(errors):
+    metrics.errors.inc("schema")
+    return JSONResponse({"error": "; ".join(errors)}, status_code=400)
+
+
+async def invocations(request):
+    start = time.perf_counter()
+    metrics.in_flight.inc()
+    try:
+        return await invoke(request)
+    finally:
+        metrics.in_flight.dec()
+        metrics.request_seconds.observe(time.perf_counter() - start)
+
+
+async def invoke(request):
+    # One model, and so one schema and preprocessing plan, for the whole request
+    model = model_reloader.model
+    try:
+        content_type = request.headers.get("content-type", "").split(";")[0].strip()
+        if content_type in BINARY_CONTENT_TYPES:
+            input_data = decode_frame(content_type, await request.body())
+            errors = payload_errors(input_data, model)
+            if errors:
+                return schema_error_response(errors)
+            predictions = await batcher.submit(preprocess_data(input_data, model))
+            serialize_start = time.perf_counter()
+            body = encode_predictions(content_type, predictions)
+            metrics.serialize_seconds.observe(time.perf_counter() - serialize_start)
+            return Response(body, media_type=content_type)
+
+        data = await request.json()
+        if 'dataframe_records' in data:
+            input_data = data['dataframe_records']
+        elif 'dataframe_split' in data:
+            split = data['dataframe_split']
+            input_data = pd.DataFrame(split['data'], columns=split['columns'])
+        else:
+            metrics.errors.inc("bad_request")
+            return JSONResponse(
+                {"error": "Expected 'dataframe_records' or 'dataframe_split' format in input data"},
+                status_code=400,
+            )
+
+        errors = payload_errors(input_data, model)
+        if errors:
+            return schema_error_response(errors)
+
+        # Preprocess per request so each payload keeps its own missing-column handling,
+        # then let the batcher coalesce the model calls.
+        predictions = await batcher.submit(preprocess_data(input_data, model))
+        serialize_start = time.perf_counter()
+        response = JSONResponse({"predictions": predictions.tolist()})
+        metrics.serialize_seconds.observe(time.perf_counter() - serialize_start)
+        return response
+    except PayloadError as e:
+        metrics.errors.inc("bad_request")
+        return JSONResponse({"error": str(e)}, status_code=400)
+    except Exception as e:
+        metrics.errors.inc(type(e).__name__)
+        return JSONResponse({"error": f"Prediction error: {str(e)}"}, status_code=500)
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app):
+    await batcher.start()
+    start_background_tasks()
+    yield
+    await batcher.stop()
+
+
+app = Starlette(
+    routes=[
+        Route('/health', health, methods=['GET']),
+        Route('/ready', ready, methods=['GET']),
+        Route('/metrics', prometheus_metrics, methods=['GET']),
+        Route('/metrics/cache', cache_metrics, methods=['GET']),
+        Route('/model', model_status, methods=['GET']),
+        Route('/model/reload', reload_model, methods=['POST']),
+        Route('/invocations', invocations, methods=['POST']),
+    ],
+    lifespan=lifespan,
+)
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", default=8237, show_default=True)
+@click.option("--max-batch-size", default=MAX_BATCH_SIZE, show_default=True, help="Rows per model call.")
+@click.option("--max-wait-ms", default=MAX_WAIT_MS, show_default=True, help="Longest a request waits for a batch to fill.")
+def main(host:str, port:int, max_batch_size:int, max_wait_ms:float):
+    batcher.max_batch_size = max_batch_size
+    batcher.max_wait = max_wait_ms / 1000
+    uvicorn.run(app, host=host, port=port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Throughput and latency of the micro-batching ASGI server (async_server.py)
+against the sync Flask server (run_server.py, one worker) at 1, 10 and 100
+concurrent clients.
+
+Run from the repository root (MODEL_PATH must point at a trained model):
+    python -m benchmarks.bench_async_server --duration 10 --max-wait-ms 5
+"""
+import argparse
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+from benchmarks.load_test_server import PAYLOAD, request, wait_until_healthy
+
+
+def drive(host, port, clients, duration):
+    latencies = [[] for _ in range(clients)]
+    errors = [0] * clients
+    deadline = time.time() + duration
+
+    def client(slot):
+        while time.time() < deadline:
+            start = time.perf_counter()
+            try:
+                status = request(host, port, "POST", "/invocations", PAYLOAD)
+            except OSError:
+                status = None
+            if status == 200:
+                latencies[slot].append(time.perf_counter() - start)
+            else:
+                errors[slot] += 1
+
+    threads = [threading.Thread(target=client, args=(slot,)) for slot in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return np.concatenate([np.asarray(l) for l in latencies]), sum(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--max-batch-size", type=int, default=256)
+    parser.add_argument("--max-wait-ms", type=float, default=5.0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8237)
+    args = parser.parse_args()
+
+    servers = {
+        "flask": ["run_server.py", "--workers", "1"],
+        "async": ["async_server.py", "--max-batch-size", str(args.max_batch_size),
+                  "--max-wait-ms", str(args.max_wait_ms)],
+    }
+    print(f"{'server':<8}{'clients':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, command in servers.items():
+        server = subprocess.Popen(
+            [sys.executable, *command, "--host", args.host, "--port", str(args.port)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_until_healthy(args.host, args.port)
+            for clients in args.clients:
+                latencies, errors = drive(args.host, args.port, clients, args.duration)
+                p50, p99 = (np.percentile(latencies, [50, 99]) * 1e3) if len(latencies) else (np.nan, np.nan)
+                print(f"{name:<8}{clients:>8}{len(latencies) / args.duration:>10.1f}"
+                      f"{p50:>10.2f}{p99:>10.2f}{errors:>8}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+ElasticNetPathStrategy (warm-started paths with a shared Gram matrix per fold) against
+fitting every (alpha, l1_ratio, fold) candidate independently from scratch on
+the same alpha grid and folds, on the numeric Ames features. Both should
+select the same point, or a neighbouring alpha when two score within the
+solvers' tolerance of each other.
+
+Run from the repository root:
+    python -m benchmarks.bench_enet_path --replicate 5 --n-alphas 100
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.linear_model import ElasticNet
+from sklearn.metrics import mean_squared_error
+from sklearn.model_selection import KFold
+from sklearn.preprocessing import StandardScaler
+
+from src.model_building import ElasticNetPathStrategy
+
+
+def independent_fits(X, y, alphas, l1_ratios, folds, seed):
+    """Cross-validated MSE of every candidate, each fit cold from zero coefficients."""
+    X = X.to_numpy(dtype=np.float64)
+    y = y.to_numpy()
+    splits = list(KFold(folds, shuffle=True, random_state=seed).split(X))
+    # Scale each fold on its training rows, as the strategy does
+    scaled = [(StandardScaler().fit(X[train]), train, test) for train, test in splits]
+    scaled = [(scaler.transform(X[train]), y[train], scaler.transform(X[test]), y[test]) for scaler, train, test in scaled]
+    mse = np.zeros((len(l1_ratios), len(alphas[0])))
+    for i, l1_ratio in enumerate(l1_ratios):
+        for j, alpha in enumerate(alphas[i]):
+            for X_fit, y_fit, X_val, y_val in scaled:
+                model = ElasticNet(alpha=alpha, l1_ratio=l1_ratio).fit(X_fit, y_fit)
+                mse[i, j] += mean_squared_error(y_val, model.predict(X_val)) / folds
+    i, j = np.unravel_index(np.argmin(mse), mse.shape)
+    return {"alpha": float(alphas[i][j]), "l1_ratio": float(l1_ratios[i])}
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv", default="extracted_data/AmesHousing.csv")
+    parser.add_argument("--replicate", type=int, default=5)
+    parser.add_argument("--n-alphas", type=int, default=100)
+    parser.add_argument("--cv", type=int, default=5)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=ConvergenceWarning)
+
+    df = pd.concat([pd.read_csv(args.csv)] * args.replicate, ignore_index=True)
+    X = df.select_dtypes(include="number").drop(columns=["SalePrice", "Order", "PID"])
+    X = X.fillna(X.median())
+    y = df["SalePrice"]
+    print(f"{len(X)} rows x {X.shape[1]} features, {args.n_alphas} alphas, {args.cv} folds")
+
+    strategy = ElasticNetPathStrategy(n_alphas=args.n_alphas, cv=args.cv)
+    start = time.perf_counter()
+    strategy.build_and_train_model(X, y)
+    path_seconds = time.perf_counter() - start
+
+    alphas = np.atleast_2d(strategy.alphas_)
+    start = time.perf_counter()
+    independent = independent_fits(X, y, alphas, strategy.l1_ratios, args.cv, strategy.seed)
+    independent_seconds = time.perf_counter() - start
+
+    print(f"{'method':<20}{'seconds':>10}  best")
+    print(f"{'warm-started path':<20}{path_seconds:>10.2f}  {strategy.best_params_}")
+    print(f"{'independent fits':<20}{independent_seconds:>10.2f}  {independent}")
+    print(f"speedup: {independent_seconds / path_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Peak RSS of a 5-step feature engineering chain on a replicated Ames dataset,
+run sequentially (one copy per step), chained (one copy) and chained in place.
+Each mode runs in a fresh process because peak RSS only ever grows.
+
+Run from the repository root (Unix only, uses the resource module):
+    python -m benchmarks.bench_feature_engineering --replicate 10
+"""
+import argparse
+import resource
+import subprocess
+import sys
+import time
+
+import pandas as pd
+
+from src.feature_engineering import (
+    ChainedTransformation,
+    LogTransformation,
+    MinMaxScaling,
+    OneHotEncoding,
+    StandardScaling,
+)
+
+MODES = ["sequential", "chained", "inplace"]
+
+
+def peak_rss_mib():
+    # ru_maxrss is reported in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def build_chain():
+    return [
+        LogTransformation(["Gr Liv Area", "Lot Area"]),
+        StandardScaling(["1st Flr SF", "Total Bsmt SF", "Garage Area"]),
+        MinMaxScaling(["Year Built", "Year Remod/Add"]),
+        LogTransformation(["SalePrice"]),
+        OneHotEncoding(["Neighborhood", "MS Zoning"]),
+    ]
+
+
+def run_mode(mode, csv_path, replicate):
+    df = pd.concat([pd.read_csv(csv_path)] * replicate, ignore_index=True)
+    baseline = peak_rss_mib()
+
+    start = time.perf_counter()
+    if mode == "sequential":
+        for strategy in build_chain():
+            df = strategy.apply_transformation(df)
+    else:
+        df = ChainedTransformation(build_chain(), inplace=(mode == "inplace")).apply_transformation(df)
+    elapsed = time.perf_counter() - start
+
+    print(f"{mode:<12}{str(df.shape):<16}{elapsed:>9.3f}{baseline:>14.1f}{peak_rss_mib():>14.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv", default="extracted_data/AmesHousing.csv")
+    parser.add_argument("--replicate", type=int, default=10)
+    parser.add_argument("--mode", choices=MODES)
+    args = parser.parse_args()
+
+    if args.mode:
+        run_mode(args.mode, args.csv, args.replicate)
+        return
+
+    print(f"{'mode':<12}{'shape':<16}{'seconds':>9}{'loaded MiB':>14}{'peak MiB':>14}")
+    for mode in MODES:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_feature_engineering",
+             "--csv", args.csv, "--replicate", str(args.replicate), "--mode", mode],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
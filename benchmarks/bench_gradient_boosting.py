@@ -0,0 +1,60 @@
+"""
+HistGradientBoostingStrategy against the ElasticNet pipeline of
+step/model_buildd.py (mean imputation, sparse one-hot, ElasticNet(alpha=1.0,
+l1_ratio=0.5)) on a held-out split of Ames: training time, prediction latency
+for a single row and for the whole test set, and test MSE.
+
+Run from the repository root:
+    python -m benchmarks.bench_gradient_boosting --replicate 1
+"""
+import argparse
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+from sklearn.exceptions import ConvergenceWarning
+from sklearn.metrics import mean_squared_error
+from sklearn.model_selection import train_test_split
+
+from benchmarks.bench_onehot import build_pipeline
+from src.model_building import HistGradientBoostingStrategy
+
+
+def latency_ms(pipeline, X, repeats):
+    start = time.perf_counter()
+    for _ in range(repeats):
+        pipeline.predict(X)
+    return (time.perf_counter() - start) / repeats * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv", default="extracted_data/AmesHousing.csv")
+    parser.add_argument("--replicate", type=int, default=1)
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore", category=ConvergenceWarning)
+
+    df = pd.concat([pd.read_csv(args.csv)] * args.replicate, ignore_index=True)
+    df["MS SubClass"] = df["MS SubClass"].astype(str)
+    X, y = df.drop(columns=["SalePrice", "Order", "PID"]), df["SalePrice"]
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+
+    builders = {
+        "elasticnet": lambda: build_pipeline(X_train, sparse=True).fit(X_train, y_train),
+        "hist_gbm": lambda: HistGradientBoostingStrategy().build_and_train_model(X_train, y_train),
+    }
+    print(f"{'model':<12}{'fit s':>8}{'1 row ms':>10}{f'{len(X_test)} rows ms':>14}{'test MSE':>12}{'RMSE':>8}")
+    for name, build in builders.items():
+        start = time.perf_counter()
+        pipeline = build()
+        fit_seconds = time.perf_counter() - start
+        single = latency_ms(pipeline, X_test.iloc[:1], args.repeats)
+        batch = latency_ms(pipeline, X_test, max(1, args.repeats // 10))
+        mse = mean_squared_error(y_test, pipeline.predict(X_test))
+        print(f"{name:<12}{fit_seconds:>8.2f}{single:>10.2f}{batch:>14.2f}{mse:>12.3e}{np.sqrt(mse):>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Hot model reload under load: drives /invocations against run_server.py while
+the served model's MLmodel file is touched every few seconds, then reports the
+swaps the server performed, their load/warm-up/swap latency and how many
+requests failed during the run.
+
+Run from the repository root (MODEL_PATH must point at a local model directory):
+    python -m benchmarks.bench_hot_reload --reloads 5 --interval 3 --clients 8
+"""
+import argparse
+import http.client
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from benchmarks.load_test_server import PAYLOAD, request, wait_until_healthy
+
+
+def model_status(host, port):
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    try:
+        connection.request("GET", "/model")
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--reloads", type=int, default=5)
+    parser.add_argument("--interval", type=float, default=3.0, help="Seconds between model updates.")
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--poll-seconds", type=float, default=0.5)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8237)
+    args = parser.parse_args()
+
+    mlmodel = os.path.join(os.environ["MODEL_PATH"], "MLmodel")
+    env = dict(os.environ, MODEL_POLL_SECONDS=str(args.poll_seconds))
+    server = subprocess.Popen(
+        [sys.executable, "run_server.py", "--workers", "1", "--host", args.host, "--port", str(args.port)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    try:
+        wait_until_healthy(args.host, args.port)
+        done = threading.Event()
+        ok = [0] * args.clients
+        errors = [0] * args.clients
+
+        def client(slot):
+            while not done.is_set():
+                try:
+                    status = request(args.host, args.port, "POST", "/invocations", PAYLOAD)
+                except OSError:
+                    status = None
+                if status == 200:
+                    ok[slot] += 1
+                else:
+                    errors[slot] += 1
+
+        threads = [threading.Thread(target=client, args=(slot,)) for slot in range(args.clients)]
+        for thread in threads:
+            thread.start()
+
+        print(f"{'reload':>7}{'load ms':>10}{'warm-up ms':>12}{'swap us':>10}")
+        for reload in range(1, args.reloads + 1):
+            time.sleep(args.interval)
+            os.utime(mlmodel)
+            time.sleep(args.poll_seconds * 2)
+            timings = model_status(args.host, args.port)["last_reload"]
+            print(f"{reload:>7}{timings['load_seconds'] * 1e3:>10.1f}"
+                  f"{timings['warmup_seconds'] * 1e3:>12.1f}{timings['swap_seconds'] * 1e6:>10.1f}")
+
+        done.set()
+        for thread in threads:
+            thread.join()
+        status = model_status(args.host, args.port)
+        print(f"\nswaps: {status['reload_count'] - 1}  requests: {sum(ok)}  failed: {sum(errors)}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
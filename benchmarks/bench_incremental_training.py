@@ -0,0 +1,85 @@
+"""
+Out-of-core training with IncrementalSGDStrategy on Ames replicated 10x and
+50x on disk, streamed through CSVDataIngestor.iter_chunks. Reports time per
+epoch and peak RSS, which should stay flat as the file grows; the in-memory
+frame of each file is shown for scale. Each size runs in a fresh process
+because peak RSS only ever grows.
+
+Run from the repository root (Unix only, uses the resource module):
+    python -m benchmarks.bench_incremental_training --replicate 10 50 --epochs 3
+"""
+import argparse
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+from src.ingest_data import CSVDataIngestor
+from src.model_building import IncrementalSGDStrategy
+
+
+def peak_rss_mib():
+    # ru_maxrss is reported in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def write_replicated(csv_path, replicate, out_path):
+    """Appends the file to itself on disk without ever holding more than one copy."""
+    df = pd.read_csv(csv_path)
+    df.to_csv(out_path, index=False)
+    for _ in range(replicate - 1):
+        df.to_csv(out_path, mode="a", header=False, index=False)
+    return len(df) * replicate, df.memory_usage(deep=True).sum() * replicate / 2**20
+
+
+def run(csv_path, replicate, epochs, chunksize):
+    workdir = tempfile.mkdtemp(prefix="incremental_")
+    try:
+        path = os.path.join(workdir, "ames.csv")
+        rows, frame_mib = write_replicated(csv_path, replicate, path)
+        baseline = peak_rss_mib()
+
+        ingestor = CSVDataIngestor(chunksize=chunksize)
+        strategy = IncrementalSGDStrategy(epochs=epochs, checkpoint_dir=os.path.join(workdir, "checkpoints"))
+        start = time.perf_counter()
+        pipeline = strategy.train_on_chunks(lambda: ingestor.iter_chunks(path))
+        elapsed = time.perf_counter() - start
+
+        sample = pd.read_csv(csv_path, nrows=1000)
+        rmse = ((pipeline.predict(sample[strategy.features]) - sample["SalePrice"]) ** 2).mean() ** 0.5
+        print(f"{replicate:>9}x{rows:>10}{frame_mib:>12.0f}{elapsed / (epochs + 1):>12.2f}"
+              f"{baseline:>12.0f}{peak_rss_mib():>10.0f}{rmse:>10.0f}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv", default="extracted_data/AmesHousing.csv")
+    parser.add_argument("--replicate", type=int, nargs="+", default=[10, 50])
+    parser.add_argument("--epochs", type=int, default=3)
+    parser.add_argument("--chunksize", type=int, default=5_000)
+    parser.add_argument("--single", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.single:
+        run(args.csv, args.replicate[0], args.epochs, args.chunksize)
+        return
+
+    print(f"{'replicate':>10}{'rows':>10}{'frame MiB':>12}{'s / pass':>12}{'start MiB':>12}{'peak MiB':>10}{'RMSE':>10}")
+    for replicate in args.replicate:
+        subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_incremental_training", "--single",
+             "--csv", args.csv, "--replicate", str(replicate),
+             "--epochs", str(args.epochs), "--chunksize", str(args.chunksize)],
+            check=True,
+        )
+
+
+if __name__ == "__main__":
+    main()
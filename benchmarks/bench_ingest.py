@@ -0,0 +1,100 @@
+"""
+Compares the original extract-then-read path (extractall into ./extracted_data,
+then read_csv) against ZipDataIngestor reading the archive's CSV in place, with
+inferred column types, with the explicit Ames dtypes (explicit_dtypes=True), and
+chunk by chunk through iter_chunks, whose peak memory is bounded by --chunksize
+rows. Also reports cold- and warm-start times for CachingDataIngestor.
+
+Run from the repository root:
+    python -m benchmarks.bench_ingest --archive Data/archive.zip --repeat 5
+"""
+import argparse
+import os
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from types import SimpleNamespace
+
+import pandas as pd
+
+from src.ingest_data import CachingDataIngestor, ZipDataIngestor
+
+
+class ExtractThenRead:
+    """The ingestion ZipDataIngestor replaced: extract the archive to disk, then read the CSV."""
+
+    def ingest(self, archive):
+        with zipfile.ZipFile(archive, "r") as zip_ref:
+            zip_ref.extractall("extracted_data")
+        csv_files = [f for f in os.listdir("extracted_data") if f.endswith(".csv")]
+        return pd.read_csv(os.path.join("extracted_data", csv_files[0]))
+
+
+class ChunkCounter:
+    """Consumes iter_chunks lazily, keeping only a running row count."""
+
+    def __init__(self, ingestor):
+        self.ingestor = ingestor
+
+    def ingest(self, archive):
+        rows = columns = 0
+        for chunk in self.ingestor.iter_chunks(archive):
+            rows += len(chunk)
+            columns = chunk.shape[1]
+        return SimpleNamespace(shape=(rows, columns))
+
+
+def measure(ingestor, archive, repeat):
+    timings = []
+    peak = 0
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        df = ingestor.ingest(archive)
+        timings.append(time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+    timings.sort()
+    return df.shape, timings[len(timings) // 2], peak
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--archive", default="Data/archive.zip")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    args = parser.parse_args()
+    archive = os.path.abspath(args.archive)
+
+    # The extract path writes into ./extracted_data, so run it in a scratch dir.
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            results = {"extract": measure(ExtractThenRead(), archive, args.repeat)}
+        finally:
+            os.chdir(cwd)
+    results.update({
+        "infer": measure(ZipDataIngestor(), archive, args.repeat),
+        "dtypes": measure(ZipDataIngestor(explicit_dtypes=True), archive, args.repeat),
+        "chunks": measure(
+            ChunkCounter(ZipDataIngestor(explicit_dtypes=True, chunksize=args.chunksize)), archive, args.repeat
+        ),
+    })
+
+    print(f"{'mode':<10}{'shape':<14}{'median s':>10}{'peak MiB':>10}")
+    for mode, (shape, median, peak) in results.items():
+        print(f"{mode:<10}{str(shape):<14}{median:>10.4f}{peak / 2**20:>10.1f}")
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cached = CachingDataIngestor(ZipDataIngestor(explicit_dtypes=True), cache_dir=cache_dir)
+        start = time.perf_counter()
+        cached.ingest(archive)
+        cold = time.perf_counter() - start
+        _, warm, _ = measure(cached, archive, args.repeat)
+    print(f"cache cold start {cold:.4f}s, warm start (median) {warm:.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Request-path cost of the serving logs: drives /invocations in-process through
+Flask's test client and compares the old per-request print calls with the
+structured logger, blocking and queue-backed, at different levels and sample
+rates. Log output goes to --sink (a temporary file by default); point it at a
+terminal or a pipe to see the effect of a slow stdout.
+
+Run from the repository root (MODEL_PATH must point at a trained model):
+    python -m benchmarks.bench_logging --requests 2000
+"""
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+
+from benchmarks.load_test_server import PAYLOAD
+
+
+def old_print_logging(invoke):
+    """The print calls /invocations made for every request before structured logging."""
+    def view():
+        print("Received prediction request")
+        print("Preprocessing 1 records...")
+        print("Making prediction...")
+        response = invoke()
+        print("Returning 1 predictions")
+        return response
+    return view
+
+
+def requests_per_second(client, n):
+    start = time.perf_counter()
+    for _ in range(n):
+        client.post("/invocations", data=PAYLOAD, content_type="application/json")
+    return n / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--repeats", type=int, default=3, help="Best of this many runs is reported.")
+    parser.add_argument("--sink", default=None, help="Where log lines are written.")
+    args = parser.parse_args()
+
+    sink_path = args.sink or os.path.join(tempfile.mkdtemp(), "serving.log")
+    # Prediction caching would hide the request path being measured
+    os.environ["PREDICTION_CACHE_SIZE"] = "0"
+    os.environ["MODEL_POLL_SECONDS"] = "0"
+    import preprocessing_server as server
+
+    configurations = [
+        ("print (before)", dict(level="INFO", queued=True), True),
+        ("sync, DEBUG, every request", dict(level="DEBUG", sample_rate=1.0, queued=False), False),
+        ("queued, DEBUG, every request", dict(level="DEBUG", sample_rate=1.0, queued=True), False),
+        ("queued, DEBUG, 1% sampled", dict(level="DEBUG", sample_rate=0.01, queued=True), False),
+        ("queued, INFO", dict(level="INFO", queued=True), False),
+    ]
+    invoke = server.app.view_functions["predict"]
+    print(f"{'logging':<32}{'req/s':>10}")
+    with open(sink_path, "a", buffering=1) as sink:
+        for name, options, prints in configurations:
+            server.serving_logger.configure(stream=sink, **options)
+            server.app.view_functions["predict"] = old_print_logging(invoke) if prints else invoke
+            client = server.app.test_client()
+            with contextlib.redirect_stdout(sink):
+                requests_per_second(client, 50)
+                rate = max(requests_per_second(client, args.requests) for _ in range(args.repeats))
+            print(f"{name:<32}{rate:>10.1f}")
+    server.serving_logger.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""
+Wall time of ElasticNetSearchStrategy on the numeric Ames features with a
+serial baseline (one in-process worker) against process pools of 4 and 8
+workers. All runs must pick the same parameters.
+
+Run from the repository root:
+    python -m benchmarks.bench_model_search --replicate 10 --workers 1 4 8
+"""
+import argparse
+import time
+import warnings
+
+import pandas as pd
+from sklearn.exceptions import ConvergenceWarning
+
+from src.model_building import ElasticNetSearchStrategy
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv", default="extracted_data/AmesHousing.csv")
+    parser.add_argument("--replicate", type=int, default=10)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--n-iter", type=int, default=None, help="Random search with this many candidates.")
+    args = parser.parse_args()
+    # The small alphas in the grid do not converge on unscaled targets; that is expected here
+    warnings.filterwarnings("ignore", category=ConvergenceWarning)
+
+    df = pd.concat([pd.read_csv(args.csv)] * args.replicate, ignore_index=True)
+    X = df.select_dtypes(include="number").drop(columns=["SalePrice", "Order", "PID"])
+    X = X.fillna(X.median())
+    y = df["SalePrice"]
+    print(f"{len(X)} rows x {X.shape[1]} features")
+
+    print(f"{'workers':>8}{'seconds':>10}{'speedup':>9}  best")
+    baseline = None
+    for workers in args.workers:
+        strategy = ElasticNetSearchStrategy(n_iter=args.n_iter, n_jobs=workers)
+        start = time.perf_counter()
+        strategy.build_and_train_model(X, y)
+        seconds = time.perf_counter() - start
+        baseline = baseline or seconds
+        print(f"{workers:>8}{seconds:>10.2f}{baseline / seconds:>8.2f}x  {strategy.best_params_}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Dense vs sparse one-hot encoding on the Ames categoricals: memory and fit time
+of the OneHotEncoding strategy, and of a ColumnTransformer + ElasticNet
+pipeline built the same way as step/model_buildd.py.
+
+Run from the repository root:
+    python -m benchmarks.bench_onehot --replicate 10
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+import scipy.sparse as sp
+from sklearn.compose import ColumnTransformer
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import ElasticNet
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder
+
+from src.feature_engineering import OneHotEncoding
+
+HIGH_CARDINALITY = ["Neighborhood", "Exterior 1st", "Exterior 2nd", "MS SubClass", "Sale Type"]
+
+
+def nbytes(matrix):
+    if sp.issparse(matrix):
+        return matrix.data.nbytes + matrix.indices.nbytes + matrix.indptr.nbytes
+    return np.asarray(matrix).nbytes
+
+
+def build_pipeline(X, sparse):
+    categorical_cols = X.select_dtypes(include=["object", "category"]).columns
+    numerical_cols = X.select_dtypes(exclude=["object", "category"]).columns
+    preprocessor = ColumnTransformer(
+        transformers=[
+            ("num", SimpleImputer(strategy="mean"), numerical_cols),
+            ("cat", Pipeline(steps=[
+                ("imputer", SimpleImputer(strategy="most_frequent")),
+                ("Onehot", OneHotEncoder(handle_unknown="ignore", sparse_output=sparse)),
+            ]), categorical_cols),
+        ],
+        sparse_threshold=1.0 if sparse else 0.0,
+    )
+    return Pipeline(steps=[("preprocessor", preprocessor), ("model", ElasticNet(alpha=1.0, l1_ratio=0.5))])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv", default="extracted_data/AmesHousing.csv")
+    parser.add_argument("--replicate", type=int, default=10)
+    args = parser.parse_args()
+
+    df = pd.concat([pd.read_csv(args.csv)] * args.replicate, ignore_index=True)
+    df["MS SubClass"] = df["MS SubClass"].astype(str)
+    X, y = df.drop(columns=["SalePrice", "Order", "PID"]), df["SalePrice"]
+
+    print(f"{'stage':<28}{'mode':<8}{'seconds':>9}{'MiB':>10}")
+    for sparse in (False, True):
+        mode = "sparse" if sparse else "dense"
+
+        start = time.perf_counter()
+        encoded = OneHotEncoding(HIGH_CARDINALITY, sparse=sparse).apply_transformation(df)
+        elapsed = time.perf_counter() - start
+        mib = encoded.memory_usage(deep=True).sum() / 2**20
+        print(f"{'OneHotEncoding strategy':<28}{mode:<8}{elapsed:>9.3f}{mib:>10.1f}")
+
+        pipeline = build_pipeline(X, sparse)
+        start = time.perf_counter()
+        pipeline.fit(X, y)
+        elapsed = time.perf_counter() - start
+        mib = nbytes(pipeline.named_steps["preprocessor"].transform(X)) / 2**20
+        print(f"{'model_buildd pipeline fit':<28}{mode:<8}{elapsed:>9.3f}{mib:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
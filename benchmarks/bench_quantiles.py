@@ -0,0 +1,63 @@
+"""
+Accuracy and speed of KLL quantile sketches against exact quantiles on the
+Ames numeric columns, for the quartiles IQROutlierDetection needs.
+
+Rank error is |F(estimate) - q| where F is the exact empirical CDF of the
+column, i.e. how far off the estimate is in quantile terms.
+
+Run from the repository root:
+    python -m benchmarks.bench_quantiles --replicate 100 --chunksize 50000
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.outlier_detection import ExactQuantileEstimator, KLLQuantileEstimator
+
+PROBABILITIES = [0.25, 0.75]
+
+
+def estimate(factory, values, chunksize):
+    estimator = factory()
+    start = time.perf_counter()
+    for offset in range(0, len(values), chunksize):
+        estimator.update(values[offset:offset + chunksize])
+    result = estimator.quantiles(PROBABILITIES)
+    return result, time.perf_counter() - start
+
+
+def max_rank_error(values, estimates):
+    errors = []
+    for column in range(values.shape[1]):
+        column_values = np.sort(values[:, column][~np.isnan(values[:, column])])
+        for probability, estimate in zip(PROBABILITIES, estimates[:, column]):
+            rank = np.searchsorted(column_values, estimate, side="right") / len(column_values)
+            errors.append(abs(rank - probability))
+    return max(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--csv", default="extracted_data/AmesHousing.csv")
+    parser.add_argument("--replicate", type=int, default=100)
+    parser.add_argument("--chunksize", type=int, default=50_000)
+    args = parser.parse_args()
+
+    numeric = pd.read_csv(args.csv).select_dtypes(include=["number"])
+    values = np.tile(numeric.to_numpy(dtype=np.float64), (args.replicate, 1))
+    # Jitter the copies so the sketch sees distinct values rather than exact repeats.
+    values += np.random.default_rng(0).normal(scale=1e-6, size=values.shape)
+    print(f"{values.shape[0]} rows x {values.shape[1]} numeric columns")
+
+    exact, exact_seconds = estimate(ExactQuantileEstimator, values, args.chunksize)
+    print(f"{'estimator':<14}{'seconds':>9}{'max rank err':>14}")
+    print(f"{'exact':<14}{exact_seconds:>9.3f}{max_rank_error(values, exact):>14.4f}")
+    for k in (50, 200, 800):
+        approx, seconds = estimate(lambda: KLLQuantileEstimator(k, seed=0), values, args.chunksize)
+        print(f"{'kll k=' + str(k):<14}{seconds:>9.3f}{max_rank_error(values, approx):>14.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Local load test for run_server.py: starts the pre-fork server with each worker
+count in turn, drives /invocations from several client processes for a fixed
+time and reports requests per second.
+
+Run from the repository root (MODEL_PATH must point at a trained model):
+    python -m benchmarks.load_test_server --workers 1 2 4 8 --clients 16 --duration 10
+"""
+import argparse
+import http.client
+import json
+import multiprocessing
+import subprocess
+import sys
+import time
+
+PAYLOAD = json.dumps({
+    "dataframe_records": [{
+        "Order": 1, "PID": 5286, "MS SubClass": 20, "Lot Frontage": 80.0,
+        "Lot Area": 9600, "Overall Qual": 5, "Overall Cond": 7,
+        "Year Built": 1961, "Year Remod/Add": 1961, "Mas Vnr Area": 0.0,
+        "BsmtFin SF 1": 700.0, "BsmtFin SF 2": 0.0, "Bsmt Unf SF": 150.0,
+        "Total Bsmt SF": 850.0, "1st Flr SF": 856, "2nd Flr SF": 854,
+        "Low Qual Fin SF": 0, "Gr Liv Area": 1710.0, "Bsmt Full Bath": 1,
+        "Bsmt Half Bath": 0, "Full Bath": 1, "Half Bath": 0,
+        "Bedroom AbvGr": 3, "Kitchen AbvGr": 1, "TotRms AbvGrd": 7,
+        "Fireplaces": 2, "Garage Yr Blt": 1961, "Garage Cars": 2,
+        "Garage Area": 500.0, "Wood Deck SF": 210.0, "Open Porch SF": 0,
+        "Enclosed Porch": 0, "3Ssn Porch": 0, "Screen Porch": 0,
+        "Pool Area": 0, "Misc Val": 0, "Mo Sold": 5, "Yr Sold": 2010,
+    }]
+})
+
+
+def request(host, port, method, path, body=None):
+    connection = http.client.HTTPConnection(host, port, timeout=30)
+    try:
+        headers = {"Content-Type": "application/json"} if body else {}
+        connection.request(method, path, body=body, headers=headers)
+        response = connection.getresponse()
+        response.read()
+        return response.status
+    finally:
+        connection.close()
+
+
+def wait_until_healthy(host, port, timeout=60):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            if request(host, port, "GET", "/health") == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Server on {host}:{port} did not become healthy within {timeout}s")
+
+
+def client(host, port, duration, results):
+    ok = errors = 0
+    deadline = time.time() + duration
+    while time.time() < deadline:
+        try:
+            if request(host, port, "POST", "/invocations", PAYLOAD) == 200:
+                ok += 1
+            else:
+                errors += 1
+        except OSError:
+            errors += 1
+    results.put((ok, errors))
+
+
+def drive(host, port, clients, duration):
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=client, args=(host, port, duration, results))
+        for _ in range(clients)
+    ]
+    for process in processes:
+        process.start()
+    totals = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+    return sum(ok for ok, _ in totals), sum(errors for _, errors in totals)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8237)
+    args = parser.parse_args()
+
+    print(f"{'workers':>8}{'requests':>10}{'errors':>8}{'req/s':>10}")
+    for workers in args.workers:
+        server = subprocess.Popen(
+            [sys.executable, "run_server.py", "--workers", str(workers),
+             "--host", args.host, "--port", str(args.port)],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+        )
+        try:
+            wait_until_healthy(args.host, args.port)
+            ok, errors = drive(args.host, args.port, args.clients, args.duration)
+            print(f"{workers:>8}{ok:>10}{errors:>8}{ok / args.duration:>10.1f}")
+        finally:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -49,6 +49,22 @@ def stop_existing_servers(port=8237):
     except:
         pass
 
+def try_hot_reload(model_path, port=8237):
+    """Ask a running preprocessing server to pick up the new model in place"""
+    try:
+        response = requests.post(f"http://127.0.0.1:{port}/model/reload", timeout=120)
+        if response.status_code == 200:
+            status = response.json()
+            print(f"Server is serving: {status['model_path']} (reloaded: {status['reloaded']})")
+            served = status.get("model_path") or ""
+            # "reloaded" alone is not enough: a server watching another store may have loaded some other model
+            if os.path.normcase(os.path.abspath(served)) == os.path.normcase(os.path.abspath(model_path)):
+                return True
+            print(f"Server is not serving {model_path}; redeploying")
+    except requests.exceptions.RequestException:
+        pass
+    return False
+
 def start_mlflow_server(model_path, port=8237):
     """Start MLflow server directly"""
     try:
@@ -91,14 +107,18 @@ def main():
     print("House Price Prediction Deployment")
     print("=" * 50)
     
-    # Stop existing servers
-    stop_existing_servers(8237)
-    
     # Find model
     model_path = find_latest_model()
     if not model_path:
         return
     
+    # A preprocessing server started with MODEL_WATCH_GLOB swaps models without a restart
+    if try_hot_reload(model_path, 8237):
+        return
+    
+    # Stop existing servers
+    stop_existing_servers(8237)
+    
     # Start server
     port = 8237
     process = start_mlflow_server(model_path, port)
@@ -25,10 +25,13 @@ def ml_pipeline():
     # DEBUG after ingestion
     raw_data = debug_data_flow(raw_data, "AFTER INGESTION")
     
-    filled_data = handle_missing(raw_data)
+    filled_data = handle_missing(raw_data, fill_values_path="artifacts/fill_values.json")
     
     engineer_data =feature_engineer(
-        filled_data, strategy="log", features=["Gr Liv Area"]
+        filled_data,
+        strategy="log",
+        features=["Gr Liv Area"],
+        state_path="artifacts/feature_engineer.joblib",
     )
     
     clean_data = outlier_detection_step(engineer_data, column_name="SalePrice")
@@ -36,7 +39,7 @@ def ml_pipeline():
     X_train, X_test, y_train, y_test = data_spliting(clean_data, target_column="SalePrice")
     #X_train, X_test, y_train, y_test = debug_data_leakage(X_train, X_test, y_train, y_test)
         
-    model = model_buildd(X_train =X_train, y_train=y_train)
+    model = model_buildd(X_train =X_train, y_train=y_train, feature_schema_path="artifacts/feature_schema.json")
     
     evaluation_metrics, mea = model_eval(trained_model=model, X_test=X_test, y_test=y_test)
     
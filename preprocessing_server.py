@@ -1,155 +1,375 @@
 import numpy as np
 import pandas as pd
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 import mlflow.pyfunc
+import logging
 import sys
 import os
+import threading
+import time
+from mlflow.types import DataType
+from src.binary_payloads import BINARY_CONTENT_TYPES, PayloadError, decode_frame, encode_predictions
+from src.feature_engineering import FeatureEngineer, LogTransformation
+from src.feature_schema import FeatureSchema
+from src.handle_missing_values import FillMissingValuesStrategy
+from src.model_reloader import ModelReloader, latest_model_dir
+from src.prediction_cache import PredictionCache
+from src.serving_logging import ServingLogger
+from src.serving_metrics import ServingMetrics
+from src.preprocessing_plan import PreprocessingPlan
 
-print("Starting preprocessing server...")
+# Structured JSON logs written off the request path. Per-request detail is
+# logged at DEBUG and sampled, e.g. LOG_LEVEL=DEBUG LOG_SAMPLE_RATE=0.01.
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+LOG_SAMPLE_RATE = float(os.environ.get("LOG_SAMPLE_RATE", "1.0"))
+serving_logger = ServingLogger()
+# The src modules log through the root logger; route them through the same queue
+logger = serving_logger.configure(level=LOG_LEVEL, sample_rate=LOG_SAMPLE_RATE, capture_root=True)
 
-# Load the model
+logger.info("Starting preprocessing server...")
+
+# Training artifacts that belong to the model being served. They are read
+# again every time a model is loaded, so a hot reload never pairs a retrained
+# model with the previous run's fill values, transforms or schema.
+# Fill values learned by the training pipeline's handle_missing step; the
+# constants are only used when that file has not been produced yet.
+FILL_VALUES_PATH = os.environ.get("FILL_VALUES_PATH", "artifacts/fill_values.json")
+DEFAULT_FILL_VALUES = {"Lot Frontage": 70, "Mas Vnr Area": 0, "Garage Yr Blt": 1978}
+# Feature engineering fitted by the training pipeline. Without it the server
+# falls back to the log transform of Gr Liv Area used in training.
+FEATURE_ENGINEER_PATH = os.environ.get("FEATURE_ENGINEER_PATH", "artifacts/feature_engineer.joblib")
+# Feature schema recorded by model_buildd. When present, payloads with columns
+# the model never saw are rejected instead of being silently filled.
+FEATURE_SCHEMA_PATH = os.environ.get("FEATURE_SCHEMA_PATH", "artifacts/feature_schema.json")
+
+# Ensure positive predictions
+MIN_PREDICTION = 50000  # Minimum $50,000
+
+# Repeat scoring of identical rows is served from memory; a size of 0 disables the cache
+PREDICTION_CACHE_SIZE = int(os.environ.get("PREDICTION_CACHE_SIZE", "100000"))
+PREDICTION_CACHE_TTL = float(os.environ.get("PREDICTION_CACHE_TTL", "3600"))
+
+# Latency histograms, batch sizes, errors and in-flight requests for /metrics
+metrics = ServingMetrics()
+
+# The cache reports the rows it actually sends to the model, not the cache hits
+prediction_cache = PredictionCache(
+    max_entries=PREDICTION_CACHE_SIZE,
+    ttl_seconds=PREDICTION_CACHE_TTL,
+    on_model_call=metrics.batch_size.observe,
+)
+
+app = Flask(__name__)
+
+# Columns the model expects, in training order
+EXPECTED_COLUMNS = [
+    "Order", "PID", "MS SubClass", "Lot Frontage", "Lot Area", 
+    "Overall Qual", "Overall Cond", "Year Built", "Year Remod/Add", 
+    "Mas Vnr Area", "BsmtFin SF 1", "BsmtFin SF 2", "Bsmt Unf SF", 
+    "Total Bsmt SF", "1st Flr SF", "2nd Flr SF", "Low Qual Fin SF", 
+    "Gr Liv Area", "Bsmt Full Bath", "Bsmt Half Bath", "Full Bath", 
+    "Half Bath", "Bedroom AbvGr", "Kitchen AbvGr", "TotRms AbvGrd", 
+    "Fireplaces", "Garage Yr Blt", "Garage Cars", "Garage Area", 
+    "Wood Deck SF", "Open Porch SF", "Enclosed Porch", "3Ssn Porch", 
+    "Screen Porch", "Pool Area", "Misc Val", "Mo Sold", "Yr Sold"
+]
+
+def integer_input_columns(model):
+    """Columns the model's logged signature declares as integers, if it has one."""
+    schema = model.metadata.get_input_schema()
+    if schema is None or not schema.has_input_names():
+        return []
+    return [spec.name for spec in schema.inputs if spec.type in (DataType.integer, DataType.long)]
+
+class ServedModel:
+    """
+    A loaded pyfunc model with the training artifacts that go with it and the
+    preprocessing plan compiled from them and its signature. The reloader swaps
+    all of it in with one reference assignment, so a request never pairs a new
+    model with the fill values, transforms or schema of the one it replaced.
+    """
+
+    def __init__(self, model, fill_values, feature_engineer=None, feature_schema=None):
+        self.model = model
+        self.metadata = model.metadata
+        self.feature_engineer = feature_engineer
+        self.feature_schema = feature_schema
+        # Compile the preprocessing once per model instead of re-deriving it per request
+        if feature_engineer is None:
+            self.log_features = ["Gr Liv Area"]
+        elif isinstance(feature_engineer.strategy, LogTransformation):
+            self.log_features = feature_engineer.strategy.features
+        else:
+            self.log_features = []
+        self.plan = PreprocessingPlan(
+            EXPECTED_COLUMNS,
+            fill_values=fill_values,
+            log_columns=self.log_features,
+            int_columns=integer_input_columns(model),
+        )
+
+    def predict(self, df):
+        # Micro-batches can hold rows preprocessed by the previous model's plan
+        uncast = [c for c in self.plan.int_columns if c in df.columns and df[c].dtype != np.int64]
+        if uncast:
+            df = df.astype(dict.fromkeys(uncast, np.int64))
+        return self.model.predict(df)
+
+def load_served_model(model_dir):
+    model = mlflow.pyfunc.load_model(model_dir)
+
+    fill_values = DEFAULT_FILL_VALUES
+    if os.path.exists(FILL_VALUES_PATH):
+        fill_values = FillMissingValuesStrategy.load(FILL_VALUES_PATH).fill_values_
+        logger.info(f"Loaded training fill values from: {FILL_VALUES_PATH}")
+
+    feature_engineer = None
+    if os.path.exists(FEATURE_ENGINEER_PATH):
+        feature_engineer = FeatureEngineer.load(FEATURE_ENGINEER_PATH)
+        logger.info(f"Loaded fitted feature engineering from: {FEATURE_ENGINEER_PATH}")
+
+    feature_schema = None
+    if os.path.exists(FEATURE_SCHEMA_PATH):
+        feature_schema = FeatureSchema.load(FEATURE_SCHEMA_PATH)
+        logger.info(f"Loaded feature schema from: {FEATURE_SCHEMA_PATH}")
+
+    return ServedModel(model, fill_values, feature_engineer, feature_schema)
+
+# Load the model. MODEL_PATH overrides the default local artifact location; with
+# MODEL_WATCH_GLOB set, the newest MLmodel matching the pattern is served instead.
+DEFAULT_MODEL_PATH = "C:/Users/iamvi/AppData/Roaming/zenml/local_stores/d6f4feec-01c1-45f4-b4d2-80dc989762f4/mlruns/489494737275752969/e78110fca4f74a7ca0477d54dec2e2cb/artifacts/model"
+MODEL_PATH = os.environ.get("MODEL_PATH", DEFAULT_MODEL_PATH)
+MODEL_WATCH_GLOB = os.environ.get("MODEL_WATCH_GLOB")
+# How often the artifact location is polled for a new model; 0 turns hot reload off
+MODEL_POLL_SECONDS = float(os.environ.get("MODEL_POLL_SECONDS", "5"))
+
+def locate_model():
+    return latest_model_dir(MODEL_WATCH_GLOB) if MODEL_WATCH_GLOB else MODEL_PATH
+
+model_reloader = ModelReloader(load_served_model, locate_model, poll_interval=MODEL_POLL_SECONDS)
 try:
-    model_path = "C:/Users/iamvi/AppData/Roaming/zenml/local_stores/d6f4feec-01c1-45f4-b4d2-80dc989762f4/mlruns/489494737275752969/e78110fca4f74a7ca0477d54dec2e2cb/artifacts/model"
-    print(f"Loading model from: {model_path}")
-    model = mlflow.pyfunc.load_model(model_path)
-    print("Model loaded successfully!")
+    if not model_reloader.check():
+        raise FileNotFoundError(f"no model matches {MODEL_WATCH_GLOB}")
+    logger.info("Model loaded successfully!")
 except Exception as e:
-    print(f"Failed to load model: {e}")
+    logger.error(f"Failed to load model: {e}")
+    serving_logger.stop()
     sys.exit(1)
 
-app = Flask(__name__)
+def clamp_predictions(predictions):
+    """Floor a whole batch of predictions at MIN_PREDICTION in one NumPy operation."""
+    return np.maximum(np.asarray(predictions, dtype=np.float64), MIN_PREDICTION)
+
+# Row used by /test and to warm up a freshly loaded model before it is swapped in
+SAMPLE_RECORD = {
+    "Order": 1, "PID": 5286, "MS SubClass": 20, "Lot Frontage": 80.0, 
+    "Lot Area": 9600, "Overall Qual": 5, "Overall Cond": 7, 
+    "Year Built": 1961, "Year Remod/Add": 1961, "Mas Vnr Area": 0.0, 
+    "BsmtFin SF 1": 700.0, "BsmtFin SF 2": 0.0, "Bsmt Unf SF": 150.0, 
+    "Total Bsmt SF": 850.0, "1st Flr SF": 856, "2nd Flr SF": 854, 
+    "Low Qual Fin SF": 0, "Gr Liv Area": 1710.0, "Bsmt Full Bath": 1, 
+    "Bsmt Half Bath": 0, "Full Bath": 1, "Half Bath": 0, 
+    "Bedroom AbvGr": 3, "Kitchen AbvGr": 1, "TotRms AbvGrd": 7, 
+    "Fireplaces": 2, "Garage Yr Blt": 1961, "Garage Cars": 2, 
+    "Garage Area": 500.0, "Wood Deck SF": 210.0, "Open Porch SF": 0, 
+    "Enclosed Porch": 0, "3Ssn Porch": 0, "Screen Porch": 0, 
+    "Pool Area": 0, "Misc Val": 0, "Mo Sold": 5, "Yr Sold": 2010
+}
+
+# Batch sizes pushed through preprocessing and the model before /ready reports
+# ready, so lazy pandas/sklearn initialization never lands on a real request
+WARMUP_BATCH_SIZES = [int(size) for size in os.environ.get("WARMUP_BATCH_SIZES", "1,16,256").split(",") if size.strip()]
+
+def warm_up(model):
+    for size in WARMUP_BATCH_SIZES:
+        model.predict(preprocess_data([SAMPLE_RECORD] * size, model))
+
+model_reloader.warmup = warm_up
+
+readiness = {"status": "warming_up", "warmup_seconds": None, "batch_sizes": WARMUP_BATCH_SIZES}
+
+def run_startup_warmup():
+    start = time.perf_counter()
+    try:
+        warm_up(model_reloader.model)
+    except Exception as e:
+        readiness.update(status="warmup_failed", error=str(e))
+        logger.error(f"Warm-up failed: {e}")
+        return
+    readiness.update(status="ready", warmup_seconds=time.perf_counter() - start)
+    logger.info(f"Warm-up finished in {readiness['warmup_seconds']:.3f}s", extra={"batch_sizes": WARMUP_BATCH_SIZES})
+
+def start_model_watcher():
+    """Poll for new models in the background; call once per serving process."""
+    if MODEL_POLL_SECONDS > 0:
+        model_reloader.start()
+
+def start_background_tasks():
+    """Start the startup warm-up and the model watcher; call once per serving process."""
+    threading.Thread(target=run_startup_warmup, name="warm-up", daemon=True).start()
+    start_model_watcher()
 
-def preprocess_data(input_data):
+def predict_processed(processed_df, model=None):
+    """Clamped predictions for preprocessed rows; only cache misses reach the model."""
+    # Read the model once so a hot reload mid-request cannot mix two models
+    model = model_reloader.model if model is None else model
+    start = time.perf_counter()
+    predictions = clamp_predictions(prediction_cache.predict(model, processed_df))
+    metrics.predict_seconds.observe(time.perf_counter() - start)
+    return predictions
+
+def preprocess_data(input_data, model=None):
     """Apply the same preprocessing as during training"""
-    # Create DataFrame
-    df = pd.DataFrame(input_data)
-    
-    print(f"Input data shape: {df.shape}")
-    print(f"Columns: {list(df.columns)}")
-    
-    # Apply the same preprocessing steps as in your training pipeline
-    # 1. Handle missing values
-    numerical_cols = [
-        "Order", "PID", "MS SubClass", "Lot Frontage", "Lot Area", 
-        "Overall Qual", "Overall Cond", "Year Built", "Year Remod/Add", 
-        "Mas Vnr Area", "BsmtFin SF 1", "BsmtFin SF 2", "Bsmt Unf SF", 
-        "Total Bsmt SF", "1st Flr SF", "2nd Flr SF", "Low Qual Fin SF", 
-        "Gr Liv Area", "Bsmt Full Bath", "Bsmt Half Bath", "Full Bath", 
-        "Half Bath", "Bedroom AbvGr", "Kitchen AbvGr", "TotRms AbvGrd", 
-        "Fireplaces", "Garage Yr Blt", "Garage Cars", "Garage Area", 
-        "Wood Deck SF", "Open Porch SF", "Enclosed Porch", "3Ssn Porch", 
-        "Screen Porch", "Pool Area", "Misc Val", "Mo Sold", "Yr Sold"
-    ]
-    
-    # Fill missing values
-    for col in numerical_cols:
-        if col in df.columns and df[col].isna().any():
-            if col == 'Lot Frontage': 
-                df[col] = df[col].fillna(70)
-            elif col == 'Mas Vnr Area': 
-                df[col] = df[col].fillna(0)
-            elif col == 'Garage Yr Blt': 
-                df[col] = df[col].fillna(1978)
-            else: 
-                df[col] = df[col].fillna(0)
-    
-    # 2. Apply feature engineering (log transformation)
-    if 'Gr Liv Area' in df.columns:
-        print(f"Applying log transformation to Gr Liv Area")
-        original_value = df['Gr Liv Area'].iloc[0]
-        df['Gr Liv Area'] = np.log1p(df['Gr Liv Area'])
-        print(f"Before: {original_value}, After: {df['Gr Liv Area'].iloc[0]:.2f}")
-    
-    # 3. Ensure correct column order
-    expected_columns = [
-        "Order", "PID", "MS SubClass", "Lot Frontage", "Lot Area", 
-        "Overall Qual", "Overall Cond", "Year Built", "Year Remod/Add", 
-        "Mas Vnr Area", "BsmtFin SF 1", "BsmtFin SF 2", "Bsmt Unf SF", 
-        "Total Bsmt SF", "1st Flr SF", "2nd Flr SF", "Low Qual Fin SF", 
-        "Gr Liv Area", "Bsmt Full Bath", "Bsmt Half Bath", "Full Bath", 
-        "Half Bath", "Bedroom AbvGr", "Kitchen AbvGr", "TotRms AbvGrd", 
-        "Fireplaces", "Garage Yr Blt", "Garage Cars", "Garage Area", 
-        "Wood Deck SF", "Open Porch SF", "Enclosed Porch", "3Ssn Porch", 
-        "Screen Porch", "Pool Area", "Misc Val", "Mo Sold", "Yr Sold"
-    ]
-    
-    # Add any missing columns
-    for col in expected_columns:
-        if col not in df.columns:
-            df[col] = 0
-            print(f"Added missing column: {col}")
-    
-    # Reorder columns
-    df = df[expected_columns]
+    start = time.perf_counter()
+    model = model_reloader.model if model is None else model
+    df = input_data if isinstance(input_data, pd.DataFrame) else pd.DataFrame(input_data)
+    processed_df = model.plan.apply_frame(df)
     
-    print(f"Preprocessing completed. Final shape: {df.shape}")
-    return df
+    # Strategies other than the log transform cannot be compiled into the plan
+    if model.feature_engineer is not None and not model.log_features:
+        processed_df = model.feature_engineer.transform(processed_df)
+    metrics.preprocess_seconds.observe(time.perf_counter() - start)
+    return processed_df
 
 @app.route('/health', methods=['GET'])
 def health():
     return jsonify({"status": "healthy"})
 
+@app.route('/ready', methods=['GET'])
+def ready():
+    """Ready only once the startup warm-up has run; 503 until then."""
+    return jsonify(readiness), 200 if readiness["status"] == "ready" else 503
+
+# Cache metrics that only ever grow; the rest are point-in-time values
+CACHE_COUNTERS = ("hits", "misses", "evictions", "expirations", "invalidations")
+
+def metric_values():
+    """Gauges and counters owned by the cache and the model reloader, for ServingMetrics.render."""
+    gauges, counters = {}, {}
+    for name, value in prediction_cache.metrics().items():
+        if name in CACHE_COUNTERS:
+            counters[f"house_price_cache_{name}_total"] = value
+        else:
+            gauges[f"house_price_cache_{name}"] = value
+    counters["house_price_model_reloads_total"] = model_reloader.reload_count
+    return {"gauges": gauges, "counters": counters}
+
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    return Response(metrics.render(**metric_values()), mimetype=ServingMetrics.CONTENT_TYPE)
+
+@app.route('/metrics/cache', methods=['GET'])
+def cache_metrics():
+    return jsonify(prediction_cache.metrics())
+
+@app.route('/model', methods=['GET'])
+def model_status():
+    return jsonify(model_reloader.status())
+
+def reload_model_now():
+    """Check for a new model now instead of waiting for the next poll; (body, status) for both servers."""
+    try:
+        reloaded = model_reloader.check()
+    except Exception as e:
+        return {"error": f"Model reload failed: {str(e)}"}, 500
+    return {"reloaded": reloaded, **model_reloader.status()}, 200
+
+@app.route('/model/reload', methods=['POST'])
+def reload_model():
+    body, status = reload_model_now()
+    return jsonify(body), status
+
 @app.route('/invocations', methods=['POST'])
 def predict():
+    start = time.perf_counter()
+    metrics.in_flight.inc()
+    try:
+        return invoke()
+    finally:
+        metrics.in_flight.dec()
+        metrics.request_seconds.observe(time.perf_counter() - start)
+
+def payload_errors(input_data, model=None):
+    """Schema problems with a payload's columns; always empty without a feature schema."""
+    feature_schema = (model_reloader.model if model is None else model).feature_schema
+    if feature_schema is None:
+        return []
+    if isinstance(input_data, pd.DataFrame):
+        columns = input_data.columns
+    else:
+        columns = set().union(*input_data)
+    return feature_schema.validate(columns)
+
+def schema_error_response(errors):
+    logger.warning("Payload does not match the feature schema", extra={"status": 400, "errors": errors})
+    metrics.errors.inc("schema")
+    return jsonify({"error": "; ".join(errors)}), 400
+
+def invoke():
+    # One model, and so one preprocessing plan, for the whole request
+    model = model_reloader.model
     try:
+        # Binary payloads skip JSON parsing and answer in the format they came in
+        if request.mimetype in BINARY_CONTENT_TYPES:
+            input_data = decode_frame(request.mimetype, request.get_data())
+            errors = payload_errors(input_data, model)
+            if errors:
+                return schema_error_response(errors)
+            predictions = predict_processed(preprocess_data(input_data, model), model)
+            serialize_start = time.perf_counter()
+            body = encode_predictions(request.mimetype, predictions)
+            metrics.serialize_seconds.observe(time.perf_counter() - serialize_start)
+            return Response(body, mimetype=request.mimetype)
+        
         # Get input data
         data = request.get_json()
-        print("Received prediction request")
         
         if 'dataframe_records' in data:
             # Convert to the format our model expects
             input_data = data['dataframe_records']
-            print(f"Preprocessing {len(input_data)} records...")
-            
-            processed_df = preprocess_data(input_data)
-            
-            # Make prediction
-            print("Making prediction...")
-            predictions = model.predict(processed_df)
-            raw_prediction = predictions[0]
-            print(f"Raw prediction: {raw_prediction}")
-            
-            # Ensure positive predictions
-            final_prediction = max(raw_prediction, 50000)  # Minimum $50,000
-            print(f"Final prediction: ${final_prediction:,.2f}")
-            
-            return jsonify({"predictions": [final_prediction]})
+        elif 'dataframe_split' in data:
+            # Column-oriented payloads are cheaper to build a DataFrame from
+            split = data['dataframe_split']
+            input_data = pd.DataFrame(split['data'], columns=split['columns'])
         else:
-            error_msg = "Expected 'dataframe_records' format in input data"
-            print(f"Error: {error_msg}")
+            error_msg = "Expected 'dataframe_records' or 'dataframe_split' format in input data"
+            logger.warning(error_msg, extra={"status": 400})
+            metrics.errors.inc("bad_request")
             return jsonify({"error": error_msg}), 400
+        
+        errors = payload_errors(input_data, model)
+        if errors:
+            return schema_error_response(errors)
+        processed_df = preprocess_data(input_data, model)
+        
+        # Make prediction
+        predictions = predict_processed(processed_df, model)
+        # Per-request detail: sampled, and skipped entirely above DEBUG
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Prediction request served", extra={"rows": len(predictions)})
+        
+        serialize_start = time.perf_counter()
+        response = jsonify({"predictions": predictions.tolist()})
+        metrics.serialize_seconds.observe(time.perf_counter() - serialize_start)
+        return response
             
+    except PayloadError as e:
+        logger.warning(str(e), extra={"status": 400})
+        metrics.errors.inc("bad_request")
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         error_msg = f"Prediction error: {str(e)}"
-        print(f"Error: {error_msg}")
+        logger.error(error_msg, extra={"status": 500, "error_type": type(e).__name__})
+        metrics.errors.inc(type(e).__name__)
         return jsonify({"error": error_msg}), 500
 
 @app.route('/test', methods=['GET'])
 def test():
     """Test endpoint with sample data"""
-    sample_data = {
-        "dataframe_records": [
-            {
-                "Order": 1, "PID": 5286, "MS SubClass": 20, "Lot Frontage": 80.0, 
-                "Lot Area": 9600, "Overall Qual": 5, "Overall Cond": 7, 
-                "Year Built": 1961, "Year Remod/Add": 1961, "Mas Vnr Area": 0.0, 
-                "BsmtFin SF 1": 700.0, "BsmtFin SF 2": 0.0, "Bsmt Unf SF": 150.0, 
-                "Total Bsmt SF": 850.0, "1st Flr SF": 856, "2nd Flr SF": 854, 
-                "Low Qual Fin SF": 0, "Gr Liv Area": 1710.0, "Bsmt Full Bath": 1, 
-                "Bsmt Half Bath": 0, "Full Bath": 1, "Half Bath": 0, 
-                "Bedroom AbvGr": 3, "Kitchen AbvGr": 1, "TotRms AbvGrd": 7, 
-                "Fireplaces": 2, "Garage Yr Blt": 1961, "Garage Cars": 2, 
-                "Garage Area": 500.0, "Wood Deck SF": 210.0, "Open Porch SF": 0, 
-                "Enclosed Porch": 0, "3Ssn Porch": 0, "Screen Porch": 0, 
-                "Pool Area": 0, "Misc Val": 0, "Mo Sold": 5, "Yr Sold": 2010
-            }
-        ]
-    }
-    
     try:
-        processed_df = preprocess_data(sample_data["dataframe_records"])
-        prediction = model.predict(processed_df)[0]
-        prediction = max(prediction, 50000)
+        model = model_reloader.model
+        processed_df = preprocess_data([SAMPLE_RECORD], model)
+        prediction = float(predict_processed(processed_df, model)[0])
         return jsonify({
             "test_prediction": prediction,
             "formatted_price": f"${prediction:,.2f}",
@@ -159,5 +379,6 @@ def test():
         return jsonify({"error": str(e), "status": "test_failed"})
 
 if __name__ == '__main__':
-    print("Server starting on http://127.0.0.1:8237")
+    start_background_tasks()
+    logger.info("Server starting on http://127.0.0.1:8237")
     app.run(host='127.0.0.1', port=8237, debug=False)
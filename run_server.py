@@ -0,0 +1,67 @@
+import gc
+import os
+
+import click
+
+# One BLAS/OpenMP thread per worker; the workers already use every core.
+for var in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(var, "1")
+
+from gunicorn.app.base import BaseApplication
+
+
+class PreforkServer(BaseApplication):
+    """
+    Runs preprocessing_server under gunicorn's pre-fork model. preload_app makes
+    the master import the app, and with it load the model, before forking, so
+    every worker shares those pages copy-on-write instead of loading its own.
+    """
+
+    def __init__(self, options):
+        self.options = options
+        super().__init__()
+
+    def load_config(self):
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from preprocessing_server import app
+
+        # Move everything loaded so far out of the GC's reach so collections in
+        # the workers do not touch, and therefore copy, the shared model pages.
+        gc.freeze()
+        return app
+
+
+def post_fork(server, worker):
+    # Threads do not survive fork, so each worker restarts its log writer,
+    # warms up and watches for models itself
+    from preprocessing_server import serving_logger, start_background_tasks
+
+    serving_logger.after_fork()
+    start_background_tasks()
+
+
+@click.command()
+@click.option("--workers", default=os.cpu_count() or 1, show_default=True, help="Number of worker processes.")
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", default=8237, show_default=True)
+@click.option("--model-path", default=None, help="MLflow model directory; defaults to $MODEL_PATH.")
+@click.option("--timeout", default=60, show_default=True, help="Worker timeout in seconds.")
+def main(workers:int, host:str, port:int, model_path:str, timeout:int):
+    if model_path:
+        os.environ["MODEL_PATH"] = model_path
+
+    PreforkServer({
+        "bind": f"{host}:{port}",
+        "workers": workers,
+        "worker_class": "sync",
+        "preload_app": True,
+        "timeout": timeout,
+        "post_fork": post_fork,
+    }).run()
+
+
+if __name__ == "__main__":
+    main()
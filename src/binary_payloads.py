@@ -0,0 +1,108 @@
+import json
+import struct
+
+import numpy as np
+import pandas as pd
+
+# Arrow IPC streaming format, e.g. written with pyarrow.ipc.new_stream.
+ARROW_STREAM = "application/vnd.apache.arrow.stream"
+
+# Raw matrix layout: a little-endian uint32 giving the length of a UTF-8 JSON
+# list of column names, that list, then row-major little-endian float64 values.
+# Predictions come back as bare little-endian float64 values.
+FLOAT64_MATRIX = "application/x-float64-matrix"
+
+BINARY_CONTENT_TYPES = (ARROW_STREAM, FLOAT64_MATRIX)
+
+_HEADER = struct.Struct("<I")
+
+
+class PayloadError(ValueError):
+    """A binary request body that is truncated or malformed; the client's fault, not the server's."""
+
+
+def decode_frame(content_type:str, body:bytes)->pd.DataFrame:
+    """
+    Decodes a request body into a DataFrame, viewing the payload's buffers
+    without copying where possible. Raises PayloadError for a body that does
+    not match its content type.
+    """
+    if content_type == ARROW_STREAM:
+        import pyarrow as pa
+
+        try:
+            table = pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+        except (pa.ArrowException, OSError) as e:
+            raise PayloadError(f"Invalid Arrow stream: {e}") from e
+        return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    if content_type == FLOAT64_MATRIX:
+        if len(body) < _HEADER.size:
+            raise PayloadError(f"Payload of {len(body)} bytes is shorter than its {_HEADER.size}-byte header")
+        (header_length,) = _HEADER.unpack_from(body)
+        offset = _HEADER.size + header_length
+        if offset > len(body):
+            raise PayloadError(f"Column header of {header_length} bytes runs past the {len(body)}-byte payload")
+        try:
+            columns = json.loads(body[_HEADER.size:offset].decode("utf-8"))
+        except (UnicodeDecodeError, json.JSONDecodeError) as e:
+            raise PayloadError(f"Column header is not a JSON list: {e}") from e
+        if not isinstance(columns, list) or not all(isinstance(c, str) for c in columns):
+            raise PayloadError("Column header must be a JSON list of column names")
+        if (len(body) - offset) % 8:
+            raise PayloadError(f"Values take {len(body) - offset} bytes, not a whole number of float64s")
+        values = np.frombuffer(body, dtype="<f8", offset=offset)
+        if len(columns) == 0 or values.size % len(columns):
+            raise PayloadError(f"Payload of {values.size} values does not fit {len(columns)} columns")
+        return pd.DataFrame(values.reshape(-1, len(columns)), columns=columns, copy=False)
+
+    raise PayloadError(f"Unsupported content type {content_type}")
+
+
+def encode_frame(content_type:str, df:pd.DataFrame)->bytes:
+    """Client-side counterpart of decode_frame."""
+    if content_type == ARROW_STREAM:
+        import pyarrow as pa
+
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    if content_type == FLOAT64_MATRIX:
+        header = json.dumps([str(c) for c in df.columns]).encode("utf-8")
+        values = np.ascontiguousarray(df.to_numpy(dtype="<f8", na_value=np.nan))
+        return _HEADER.pack(len(header)) + header + values.tobytes()
+
+    raise ValueError(f"Unsupported content type {content_type}")
+
+
+def encode_predictions(content_type:str, predictions:np.ndarray)->bytes:
+    predictions = np.asarray(predictions, dtype="<f8")
+    if content_type == ARROW_STREAM:
+        import pyarrow as pa
+
+        table = pa.table({"predictions": predictions})
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    if content_type == FLOAT64_MATRIX:
+        return predictions.tobytes()
+
+    raise ValueError(f"Unsupported content type {content_type}")
+
+
+def decode_predictions(content_type:str, body:bytes)->np.ndarray:
+    if content_type == ARROW_STREAM:
+        import pyarrow as pa
+
+        table = pa.ipc.open_stream(pa.py_buffer(body)).read_all()
+        return table.column("predictions").to_numpy()
+
+    if content_type == FLOAT64_MATRIX:
+        return np.frombuffer(body, dtype="<f8")
+
+    raise ValueError(f"Unsupported content type {content_type}")
@@ -1,6 +1,8 @@
 import logging
+import os
 from abc import ABC, abstractmethod
 
+import joblib
 import pandas as pd
 import numpy as np
 
@@ -9,67 +11,150 @@ from sklearn.preprocessing import MinMaxScaler, OneHotEncoder, StandardScaler
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
 class FeatureEngineeringStrategy(ABC):
+    # When True the strategy writes into the frame it is given instead of a copy.
+    inplace = False
+
+    def fit(self, df:pd.DataFrame)->"FeatureEngineeringStrategy":
+        """Learns whatever state transform needs. Stateless strategies keep this no-op."""
+        return self
+
     @abstractmethod
-    def apply_transformation(self, df:pd.DataFrame):
+    def transform(self, df:pd.DataFrame)->pd.DataFrame:
         pass
+
+    def apply_transformation(self, df:pd.DataFrame)->pd.DataFrame:
+        return self.fit(df).transform(df)
+
+    def _output_frame(self, df:pd.DataFrame)->pd.DataFrame:
+        return df if self.inplace else df.copy()
     
     
 class LogTransformation(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    def __init__(self, features, inplace=False):
         self.features = features
+        self.inplace = inplace
         
-    def apply_transformation(self, df:pd.DataFrame)->pd.DataFrame:
-        logging.info(f"Applying log transformation to features:{self.features}")
-        df_transformed = df.copy()
-        for feature in self.features:
-            df_transformed[feature] = np.log1p(df[feature])
-            logging.info("Log transformation completed")
+    def transform(self, df:pd.DataFrame)->pd.DataFrame:
+        logging.debug(f"Applying log transformation to features:{self.features}")
+        df_transformed = self._output_frame(df)
+        df_transformed[self.features] = np.log1p(df_transformed[self.features])
+        logging.debug("Log transformation completed")
         return df_transformed
         
         
         
 class StandardScaling(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    def __init__(self, features, inplace=False):
         self.features = features
         self.scaler = StandardScaler()
+        self.inplace = inplace
         
-    def apply_transformation(self, df:pd.DataFrame)->pd.DataFrame:
-        logging.info(f"Applying standard scaling to features:{self.features}")
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
-        logging.info("Standard Scaling completed")
+    def fit(self, df:pd.DataFrame)->"StandardScaling":
+        self.scaler.fit(df[self.features])
+        return self
+        
+    def transform(self, df:pd.DataFrame)->pd.DataFrame:
+        logging.debug(f"Applying standard scaling to features:{self.features}")
+        df_transformed = self._output_frame(df)
+        df_transformed[self.features] = self.scaler.transform(df_transformed[self.features])
+        logging.debug("Standard Scaling completed")
         return df_transformed
     
     
     
 class MinMaxScaling(FeatureEngineeringStrategy):
-    def __init__(self, features, feature_range=(0, 1)):
+    def __init__(self, features, feature_range=(0, 1), inplace=False):
         self.features = features
         self.scaler = MinMaxScaler(feature_range=feature_range)
+        self.inplace = inplace
         
-    def apply_transformation(self, df:pd.DataFrame)->pd.DataFrame:
-        logging.info(f"Aplying MinMaxScaling to features:{self.features} with range {self.scaler.feature_range}")
-        df_transformed = df.copy()
-        df_transformed[self.features] = self.scaler.fit_transform(df[self.features])
-        logging.info(f"Min-Max Scaling completed")
+    def fit(self, df:pd.DataFrame)->"MinMaxScaling":
+        self.scaler.fit(df[self.features])
+        return self
+        
+    def transform(self, df:pd.DataFrame)->pd.DataFrame:
+        logging.debug(f"Aplying MinMaxScaling to features:{self.features} with range {self.scaler.feature_range}")
+        df_transformed = self._output_frame(df)
+        df_transformed[self.features] = self.scaler.transform(df_transformed[self.features])
+        logging.debug(f"Min-Max Scaling completed")
         return df_transformed
     
     
     
 class OneHotEncoding(FeatureEngineeringStrategy):
-    def __init__(self, features):
+    def __init__(self, features, sparse=False, inplace=False):
+        """
+        sparse=True keeps the encoded columns as pandas sparse columns instead of a
+        dense float64 block, which matters for high-cardinality features.
+        """
         self.features = features
-        self.encoder = OneHotEncoder(sparse = False, drop = "first")
+        self.sparse = sparse
+        self.encoder = OneHotEncoder(sparse_output = sparse, drop = "first")
+        self.inplace = inplace
         
-    def apply_transformation(self, df:pd.DataFrame)->pd.DataFrame:
-        df_transformed = df.copy()
-        encoded_df = pd.DataFrame(
-            self.encoder.fit_transform(df[self.features]),
-            columns = self.encoder.get_feature_names_out(self.features),
-        )
-        df_transformed = df_transformed.drop(columns = self.features).reset_index(drop=True)
+    def fit(self, df:pd.DataFrame)->"OneHotEncoding":
+        self.encoder.fit(df[self.features])
+        return self
+        
+    def transform(self, df:pd.DataFrame)->pd.DataFrame:
+        encoded = self.encoder.transform(df[self.features])
+        encoded_columns = self.encoder.get_feature_names_out(self.features)
+        if self.sparse:
+            # Spell out the fill value: the encoded matrix stores only the 1.0 entries
+            encoded_df = pd.DataFrame.sparse.from_spmatrix(encoded, index = df.index, columns = encoded_columns)
+            encoded_df = encoded_df.astype(pd.SparseDtype(float, 0))
+        else:
+            encoded_df = pd.DataFrame(encoded, index = df.index, columns = encoded_columns)
+        
+        if self.inplace:
+            # Keep the caller's index and buffer; only the encoded columns are new.
+            df.drop(columns = self.features, inplace = True)
+            if self.sparse:
+                for column in encoded_columns:
+                    df[column] = encoded_df[column]
+            else:
+                df[encoded_columns] = encoded
+            logging.debug("One hot encoding completed")
+            return df
+        
+        df_transformed = df.drop(columns = self.features).reset_index(drop=True)
+        encoded_df = encoded_df.reset_index(drop=True)
         df_transformed = pd.concat([df_transformed, encoded_df], axis = 1)
-        logging.info("One hot encoding completed")
+        logging.debug("One hot encoding completed")
+        return df_transformed
+    
+    
+    
+class ChainedTransformation(FeatureEngineeringStrategy):
+    """
+    Runs several strategies as one transform. The input is copied at most once
+    (never when inplace=True) and every strategy then works on that one buffer.
+    """
+    def __init__(self, strategies, inplace=False):
+        self.strategies = list(strategies)
+        self.inplace = inplace
+        
+    def fit(self, df:pd.DataFrame)->"ChainedTransformation":
+        # Each step is fitted on the output of the steps before it.
+        self._run(df.copy(), fit=True)
+        return self
+        
+    def transform(self, df:pd.DataFrame)->pd.DataFrame:
+        return self._run(self._output_frame(df), fit=False)
+        
+    def apply_transformation(self, df:pd.DataFrame)->pd.DataFrame:
+        return self._run(self._output_frame(df), fit=True)
+        
+    def _run(self, df_transformed:pd.DataFrame, fit:bool)->pd.DataFrame:
+        logging.info(f"Applying {len(self.strategies)} chained feature engineering strategies")
+        for strategy in self.strategies:
+            previous, strategy.inplace = strategy.inplace, True
+            try:
+                if fit:
+                    strategy.fit(df_transformed)
+                df_transformed = strategy.transform(df_transformed)
+            finally:
+                strategy.inplace = previous
         return df_transformed
     
     
@@ -78,6 +163,10 @@ class FeatureEngineer:
     def __init__(self, strategy:FeatureEngineeringStrategy):
         self._strategy = strategy
         
+    @property
+    def strategy(self)->FeatureEngineeringStrategy:
+        return self._strategy
+        
     def set_strategy(self, strategy:FeatureEngineeringStrategy):
         logging.info("Switching feature engineering strategy")
         self._strategy = strategy
@@ -86,6 +175,26 @@ class FeatureEngineer:
         logging.info("Applying feature engineering strategy.")
         return self._strategy.apply_transformation(df)
     
+    def fit(self, df:pd.DataFrame)->"FeatureEngineer":
+        logging.info("Fitting feature engineering strategy.")
+        self._strategy.fit(df)
+        return self
+    
+    def transform(self, df:pd.DataFrame)->pd.DataFrame:
+        return self._strategy.transform(df)
+    
+    def save(self, path:str):
+        """Persists the fitted strategy so serving can apply the training-time transform."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        joblib.dump(self._strategy, path)
+        logging.info(f"Saved fitted feature engineering strategy to {path}")
+    
+    @classmethod
+    def load(cls, path:str)->"FeatureEngineer":
+        return cls(joblib.load(path))
+    
     
         
 if __name__ == "__main__":
@@ -0,0 +1,95 @@
+import json
+import logging
+import os
+from typing import Dict, Iterable, List
+
+from sklearn.pipeline import Pipeline
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+class FeatureSchema:
+    """
+    The input and output columns of a fitted model_buildd pipeline, read off the
+    already-fitted ColumnTransformer without another pass over the data. Saved as
+    a small JSON file so the serving side can check payload columns with a set
+    lookup instead of loading the model's preprocessing.
+    """
+
+    def __init__(
+        self,
+        numerical_columns:List[str],
+        categorical_columns:List[str],
+        categories:Dict[str, List[str]],
+        output_columns:List[str],
+    ):
+        self.numerical_columns = list(numerical_columns)
+        self.categorical_columns = list(categorical_columns)
+        self.categories = categories
+        self.output_columns = list(output_columns)
+        self._known = set(self.numerical_columns) | set(self.categorical_columns)
+
+    @property
+    def input_columns(self)->List[str]:
+        return self.numerical_columns + self.categorical_columns
+
+    @classmethod
+    def from_pipeline(cls, pipeline:Pipeline, onehot_step:str="Onehot")->"FeatureSchema":
+        """Captures the schema from a pipeline fitted by model_buildd."""
+        preprocessor = pipeline.named_steps["preprocessor"]
+        transformers = {name: (transformer, columns) for name, transformer, columns in preprocessor.transformers_}
+        numerical_columns = list(transformers["num"][1])
+        categorical_transformer, categorical_columns = transformers["cat"]
+        categorical_columns = list(categorical_columns)
+
+        output_columns = list(numerical_columns)
+        categories = {}
+        if categorical_columns:
+            onehot = categorical_transformer.named_steps[onehot_step]
+            output_columns += list(onehot.get_feature_names_out(categorical_columns))
+            categories = {
+                column: [str(value) for value in values]
+                for column, values in zip(categorical_columns, onehot.categories_)
+            }
+        return cls(numerical_columns, categorical_columns, categories, output_columns)
+
+    def validate(self, columns:Iterable[str])->List[str]:
+        """
+        Problems with a payload's columns; empty when it is acceptable. Missing
+        columns are allowed because serving fills them, but a column the model
+        has never seen is usually a misspelt feature that would silently be
+        replaced by its fill value.
+        """
+        unknown = [column for column in columns if column not in self._known]
+        if unknown:
+            return [f"Unknown columns: {unknown}"]
+        return []
+
+    def save(self, path:str):
+        """Writes the schema to a JSON file."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+        logging.info(f"Saved feature schema to {path}")
+
+    def to_dict(self)->dict:
+        return {
+            "numerical_columns": self.numerical_columns,
+            "categorical_columns": self.categorical_columns,
+            "categories": self.categories,
+            "output_columns": self.output_columns,
+        }
+
+    @classmethod
+    def load(cls, path:str)->"FeatureSchema":
+        """Restores a schema from a file written by save."""
+        with open(path) as f:
+            state = json.load(f)
+        return cls(
+            state["numerical_columns"],
+            state["categorical_columns"],
+            state["categories"],
+            state["output_columns"],
+        )
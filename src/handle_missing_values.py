@@ -1,4 +1,6 @@
+import json
 import logging
+import os
 from abc import ABC, abstractmethod
 
 import pandas as pd
@@ -30,35 +32,71 @@ class FillMissingValuesStrategy(MissingValueHandlingStrategy):
     def __init__(self, method="mean", fill_value=None):
         self.method = method
         self.fill_value = fill_value
+        self.fill_values_ = None
         
-    def handle(self, df:pd.DataFrame)-> pd.DataFrame:
-        logging.info(f"Filling missing values using method:{self.method}")
+    def fit(self, df:pd.DataFrame)->"FillMissingValuesStrategy":
+        """Computes the fill value of every column in one pass and stores them in fill_values_."""
+        logging.info(f"Learning fill values using method:{self.method}")
         
-        df_cleaned = df.copy()
         if self.method == "mean":
-            numeric_columns = df_cleaned.select_dtypes(include=['number']).columns
-            df[numeric_columns] = df_cleaned[numeric_columns].fillna(
-                df[numeric_columns].mean()
-            )
+            fill_values = df.select_dtypes(include=['number']).mean()
         elif self.method == "median":
-            numeric_columns = df_cleaned.select_dtypes(include=['number']).columns
-            df[numeric_columns] = df_cleaned[numeric_columns].fillna(
-                df[numeric_columns].median()
-            )
+            fill_values = df.select_dtypes(include=['number']).median()
         
         elif self.method == "mode":
-            for column in df_cleaned.columns:
-                df_cleaned[column].fillna(df[column].mode().iloc[0], inplace=True)
+            modes = df.mode(dropna=True)
+            fill_values = modes.iloc[0] if len(modes) else pd.Series(dtype=object)
                 
         elif self.method == "constant":
-            df_cleaned = df_cleaned.fillna(self.fill_value)
+            if self.fill_value is None:
+                raise ValueError("fill_value must be set for the 'constant' method.")
+            fill_values = pd.Series(self.fill_value, index=df.columns)
             
         else:
             logging.warning(f"Unknown method '{self.method}'. No missing values handled.")
+            fill_values = pd.Series(dtype=object)
         
-        logging.info("Missing Values filled.")
+        self.fill_values_ = fill_values.dropna().to_dict()
+        return self
+    
+    def transform(self, df:pd.DataFrame)->pd.DataFrame:
+        """Fills a batch with the stored fill values without recomputing them."""
+        if self.fill_values_ is None:
+            raise ValueError("FillMissingValuesStrategy must be fitted before transform.")
         
+        fill_values = {column: value for column, value in self.fill_values_.items() if column in df.columns}
+        df_cleaned = df.fillna(fill_values)
+        logging.info("Missing Values filled.")
         return df_cleaned
+        
+    def handle(self, df:pd.DataFrame)-> pd.DataFrame:
+        logging.info(f"Filling missing values using method:{self.method}")
+        return self.fit(df).transform(df)
+    
+    def save(self, path:str):
+        """Writes the learned fill values to a JSON file."""
+        if self.fill_values_ is None:
+            raise ValueError("FillMissingValuesStrategy must be fitted before it can be saved.")
+        
+        fill_values = {
+            column: value.item() if hasattr(value, "item") else value
+            for column, value in self.fill_values_.items()
+        }
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump({"method": self.method, "fill_values": fill_values}, f, indent=2)
+        logging.info(f"Saved fill values to {path}")
+    
+    @classmethod
+    def load(cls, path:str)->"FillMissingValuesStrategy":
+        """Restores a fitted strategy from a file written by save."""
+        with open(path) as f:
+            state = json.load(f)
+        strategy = cls(method=state["method"])
+        strategy.fill_values_ = state["fill_values"]
+        return strategy
     
     
     
@@ -1,41 +1,507 @@
+import hashlib
+import json
+import logging
 import os
+import time
 import zipfile
+import numpy as np
 import pandas as pd
 from abc import  ABC, abstractmethod
+from typing import Iterable, Iterator, Optional
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Column types of AmesHousing.csv, matching what pandas infers on a full read.
+# Passing them explicitly lets chunked reads skip per-chunk type inference and
+# keeps every chunk on the same dtype so they concatenate cleanly.
+AMES_DTYPES = {
+    "Order": "int64",
+    "PID": "int64",
+    "MS SubClass": "int64",
+    "MS Zoning": "object",
+    "Lot Frontage": "float64",
+    "Lot Area": "int64",
+    "Street": "object",
+    "Alley": "object",
+    "Lot Shape": "object",
+    "Land Contour": "object",
+    "Utilities": "object",
+    "Lot Config": "object",
+    "Land Slope": "object",
+    "Neighborhood": "object",
+    "Condition 1": "object",
+    "Condition 2": "object",
+    "Bldg Type": "object",
+    "House Style": "object",
+    "Overall Qual": "int64",
+    "Overall Cond": "int64",
+    "Year Built": "int64",
+    "Year Remod/Add": "int64",
+    "Roof Style": "object",
+    "Roof Matl": "object",
+    "Exterior 1st": "object",
+    "Exterior 2nd": "object",
+    "Mas Vnr Type": "object",
+    "Mas Vnr Area": "float64",
+    "Exter Qual": "object",
+    "Exter Cond": "object",
+    "Foundation": "object",
+    "Bsmt Qual": "object",
+    "Bsmt Cond": "object",
+    "Bsmt Exposure": "object",
+    "BsmtFin Type 1": "object",
+    "BsmtFin SF 1": "float64",
+    "BsmtFin Type 2": "object",
+    "BsmtFin SF 2": "float64",
+    "Bsmt Unf SF": "float64",
+    "Total Bsmt SF": "float64",
+    "Heating": "object",
+    "Heating QC": "object",
+    "Central Air": "object",
+    "Electrical": "object",
+    "1st Flr SF": "int64",
+    "2nd Flr SF": "int64",
+    "Low Qual Fin SF": "int64",
+    "Gr Liv Area": "int64",
+    "Bsmt Full Bath": "float64",
+    "Bsmt Half Bath": "float64",
+    "Full Bath": "int64",
+    "Half Bath": "int64",
+    "Bedroom AbvGr": "int64",
+    "Kitchen AbvGr": "int64",
+    "Kitchen Qual": "object",
+    "TotRms AbvGrd": "int64",
+    "Functional": "object",
+    "Fireplaces": "int64",
+    "Fireplace Qu": "object",
+    "Garage Type": "object",
+    "Garage Yr Blt": "float64",
+    "Garage Finish": "object",
+    "Garage Cars": "float64",
+    "Garage Area": "float64",
+    "Garage Qual": "object",
+    "Garage Cond": "object",
+    "Paved Drive": "object",
+    "Wood Deck SF": "int64",
+    "Open Porch SF": "int64",
+    "Enclosed Porch": "int64",
+    "3Ssn Porch": "int64",
+    "Screen Porch": "int64",
+    "Pool Area": "int64",
+    "Pool QC": "object",
+    "Fence": "object",
+    "Misc Feature": "object",
+    "Misc Val": "int64",
+    "Mo Sold": "int64",
+    "Yr Sold": "int64",
+    "Sale Type": "object",
+    "Sale Condition": "object",
+    "SalePrice": "int64",
+}
+
 
 class DataIngestor(ABC):
     @abstractmethod
     def ingest(self, filepath:str)->pd.DataFrame:
         pass
-    
+
+    def iter_chunks(self, file_path:str)->Iterator[pd.DataFrame]:
+        """Yield the file as a sequence of DataFrames. Formats with a native chunked reader override this."""
+        yield self.ingest(file_path)
+
+    def cache_config(self)->dict:
+        """Settings that can change this ingestor's output; part of the ingestion cache key."""
+        config = {"class": type(self).__name__}
+        for name, value in sorted(vars(self).items()):
+            config[name] = value.cache_config() if isinstance(value, DataIngestor) else value
+        return config
+
 class ZipDataIngestor(DataIngestor):
+    def __init__(self, explicit_dtypes:bool=False, chunksize:int=50_000, dtype:Optional[dict]=None):
+        """
+        The CSV member is always read directly out of the archive, never
+        extracted to disk. explicit_dtypes=True parses it with `dtype` instead of
+        letting pandas infer every column; `dtype` defaults to AMES_DTYPES and
+        columns it does not name are inferred as usual. ingest returns the whole
+        frame; iter_chunks yields it `chunksize` rows at a time for callers that
+        need memory bounded by the chunk size.
+        """
+        self.explicit_dtypes = explicit_dtypes
+        self.chunksize = chunksize
+        self.dtype = AMES_DTYPES if dtype is None else dtype
+
     def ingest(self, file_path:str)->pd.DataFrame:
-        if not file_path.endswith(".zip"):
+        if not zipfile.is_zipfile(file_path):
             raise ValueError("The provided file is not a .zip file.")
-        
+
         with zipfile.ZipFile(file_path, "r") as zip_ref:
-            zip_ref.extractall("extracted_data")
-            
-        extracted_files = os.listdir("extracted_data")
-        csv_files =[f for f in extracted_files if f.endswith(".csv")]
-        
-        if len(csv_files) == 0:
-            raise FileNotFoundError("No CSV file found in the extracted data.")
-        if len(csv_files) > 1:
+            with zip_ref.open(self.csv_member(zip_ref)) as csv_stream:
+                return pd.read_csv(csv_stream, dtype=self.read_dtype)
+
+    def iter_chunks(self, file_path:str)->Iterator[pd.DataFrame]:
+        """Yield the archive's CSV as DataFrame chunks without writing it to disk."""
+        with zipfile.ZipFile(file_path, "r") as zip_ref:
+            with zip_ref.open(self.csv_member(zip_ref)) as csv_stream:
+                reader = pd.read_csv(csv_stream, dtype=self.read_dtype, chunksize=self.chunksize)
+                for chunk in reader:
+                    yield chunk
+
+    @property
+    def read_dtype(self)->Optional[dict]:
+        return self.dtype if self.explicit_dtypes else None
+
+    @staticmethod
+    def csv_member(zip_ref:zipfile.ZipFile)->str:
+        csv_members = [name for name in zip_ref.namelist() if name.endswith(".csv")]
+
+        if len(csv_members) == 0:
+            raise FileNotFoundError("No CSV file found in the zip archive.")
+        if len(csv_members) > 1:
             raise ValueError("Multiple csv file found please specify which one to use")
-        
-        csv_file_path  = os.path.join("extracted_data", csv_files[0])
-        df = pd.read_csv(csv_file_path)
-            
-        return df
-    
-class DataIngestorFactory:
+        return csv_members[0]
+
+
+class CachingDataIngestor(DataIngestor):
+    """
+    Wraps another ingestor and keeps its parsed output as Feather files named
+    after the SHA-256 of the source file. Later runs on an unchanged source load
+    the Feather file memory-mapped instead of re-parsing. The least recently
+    used entries are evicted once the cache grows past `max_cache_bytes`.
+    """
+
+    def __init__(self, ingestor:DataIngestor, cache_dir:str=".ingest_cache", max_cache_bytes:int=1 << 30):
+        self.ingestor = ingestor
+        self.cache_dir = cache_dir
+        self.max_cache_bytes = max_cache_bytes
+
     @staticmethod
-    def get_data_ingestor(file_extension: str) -> DataIngestor:
-        if file_extension == ".zip":
-            return ZipDataIngestor()
+    def file_digest(file_path:str, block_size:int=1 << 20)->str:
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(block_size), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def cache_path(self, file_path:str, file_digest:Optional[str]=None)->str:
+        # The wrapped ingestor's settings, including any dtype schema, are part of the
+        # key so changing them never serves a frame parsed the old way.
+        config = json.dumps(self.ingestor.cache_config(), sort_keys=True, default=str)
+        config_digest = hashlib.sha256(config.encode()).hexdigest()[:16]
+        file_digest = file_digest or self.file_digest(file_path)
+        key = f"{type(self.ingestor).__name__}-{config_digest}-{file_digest}"
+        return os.path.join(self.cache_dir, f"{key}.feather")
+
+    def ingest(self, file_path:str)->pd.DataFrame:
+        from pyarrow import feather
+
+        start = time.perf_counter()
+        digest = self.file_digest(file_path)
+        cached = self.cache_path(file_path, digest)
+
+        if os.path.exists(cached):
+            df = feather.read_table(cached, memory_map=True).to_pandas()
+            os.utime(cached)
+            logging.info(f"Ingestion cache hit for {file_path} ({time.perf_counter() - start:.3f}s)")
+            return df
+
+        df = self.ingestor.ingest(file_path)
+        # Ingesting may have written a schema that is part of the key; store under the final key
+        cached = self.cache_path(file_path, digest)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = f"{cached}.{os.getpid()}.tmp"
+        feather.write_feather(df, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, cached)
+        self.evict()
+        logging.info(f"Ingestion cache miss for {file_path} ({time.perf_counter() - start:.3f}s)")
+        return df
+
+    def evict(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if name.endswith(".feather"):
+                path = os.path.join(self.cache_dir, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        # Oldest first; the entry just written is the newest so it goes last.
+        for _, size, path in sorted(entries)[:-1]:
+            if total <= self.max_cache_bytes:
+                break
+            os.remove(path)
+            total -= size
+            logging.info(f"Evicted ingestion cache entry {path}")
+
+
+class CSVDataIngestor(DataIngestor):
+    def __init__(self, chunksize:int=50_000, dtype:Optional[dict]=None, compression:str="infer"):
+        self.chunksize = chunksize
+        self.dtype = dtype
+        self.compression = compression
+
+    def ingest(self, file_path:str)->pd.DataFrame:
+        return pd.read_csv(file_path, dtype=self.dtype, compression=self.compression)
+
+    def iter_chunks(self, file_path:str)->Iterator[pd.DataFrame]:
+        with pd.read_csv(
+            file_path, dtype=self.dtype, compression=self.compression, chunksize=self.chunksize
+        ) as reader:
+            for chunk in reader:
+                yield chunk
+
+
+class GzipCSVDataIngestor(CSVDataIngestor):
+    def __init__(self, chunksize:int=50_000, dtype:Optional[dict]=None):
+        super().__init__(chunksize=chunksize, dtype=dtype, compression="gzip")
+
+
+class ParquetDataIngestor(DataIngestor):
+    def __init__(self, batch_size:int=50_000):
+        self.batch_size = batch_size
+
+    def ingest(self, file_path:str)->pd.DataFrame:
+        return pd.read_parquet(file_path)
+
+    def iter_chunks(self, file_path:str)->Iterator[pd.DataFrame]:
+        from pyarrow import parquet
+
+        parquet_file = parquet.ParquetFile(file_path)
+        for batch in parquet_file.iter_batches(batch_size=self.batch_size):
+            yield batch.to_pandas()
+
+
+class FeatherDataIngestor(DataIngestor):
+    def ingest(self, file_path:str)->pd.DataFrame:
+        from pyarrow import feather
+
+        return feather.read_table(file_path, memory_map=True).to_pandas()
+
+    def iter_chunks(self, file_path:str)->Iterator[pd.DataFrame]:
+        import pyarrow as pa
+
+        # Feather v2 is the Arrow IPC file format, so it can be read batch by batch.
+        with pa.memory_map(file_path, "r") as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                yield reader.get_batch(i).to_pandas()
+
+
+class JSONLDataIngestor(DataIngestor):
+    def __init__(self, chunksize:int=50_000):
+        self.chunksize = chunksize
+
+    def ingest(self, file_path:str)->pd.DataFrame:
+        return pd.read_json(file_path, lines=True)
+
+    def iter_chunks(self, file_path:str)->Iterator[pd.DataFrame]:
+        with pd.read_json(file_path, lines=True, chunksize=self.chunksize) as reader:
+            for chunk in reader:
+                yield chunk
+
+
+def _raw_value(value):
+    """Plain Python value of a numpy scalar, so it round-trips through the JSON schema."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def infer_compact_schema(df:pd.DataFrame, max_unique_ratio:float=0.5)->dict:
+    """
+    Returns {column: {"dtype": ..., ["categories": [...]]}} with the smallest
+    integer/float type that holds each numeric column and a categorical for
+    string columns whose distinct values are at most `max_unique_ratio` of the rows.
+    """
+    return infer_compact_schema_from_chunks([df], max_unique_ratio)
+
+
+def infer_compact_schema_from_chunks(chunks:Iterable[pd.DataFrame], max_unique_ratio:float=0.5)->dict:
+    """
+    infer_compact_schema over a whole file read in chunks. Each chunk's numeric
+    types are widened with those of the chunks before it, categories are the
+    union of every chunk's values and the unique ratio is checked against the
+    total row count, so a late chunk with larger values or new labels still fits.
+    """
+    rows = 0
+    numeric = {}
+    values = {}
+    for chunk in chunks:
+        rows += len(chunk)
+        for column in chunk.columns:
+            series = chunk[column]
+            if pd.api.types.is_integer_dtype(series):
+                dtype = pd.to_numeric(series, downcast="integer").dtype
+            elif pd.api.types.is_float_dtype(series):
+                dtype = pd.to_numeric(series, downcast="float").dtype
+            elif pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series):
+                values.setdefault(column, set()).update(_raw_value(v) for v in series.dropna().unique())
+                continue
+            else:
+                continue
+            numeric[column] = np.promote_types(numeric[column], dtype) if column in numeric else dtype
+
+    schema = {}
+    for column, dtype in numeric.items():
+        # Numeric in some chunks and text in others: leave the column as read
+        if column not in values:
+            schema[column] = {"dtype": str(dtype)}
+    for column, distinct in values.items():
+        if column not in numeric and len(distinct) <= max_unique_ratio * max(rows, 1):
+            schema[column] = {"dtype": "category", "categories": sorted(distinct, key=str)}
+    return schema
+
+
+def apply_schema(df:pd.DataFrame, schema:dict)->pd.DataFrame:
+    """
+    Casts `df` to a schema from infer_compact_schema. Columns whose new values no
+    longer fit the stored integer type keep their current type, and values not
+    seen when the schema was inferred are appended to the categories.
+    """
+    converted = {}
+    for column, spec in schema.items():
+        if column not in df.columns:
+            continue
+        series = df[column]
+        dtype = spec["dtype"]
+
+        if dtype == "category":
+            categories = spec["categories"]
+            unseen = {_raw_value(v) for v in series.dropna().unique()} - set(categories)
+            if unseen:
+                categories = categories + sorted(unseen, key=str)
+            converted[column] = series.astype(pd.CategoricalDtype(categories))
+        elif np.issubdtype(np.dtype(dtype), np.integer):
+            bounds = np.iinfo(dtype)
+            if series.isna().any() or series.min() < bounds.min or series.max() > bounds.max:
+                logging.warning(f"Values of '{column}' do not fit {dtype}; keeping {series.dtype}.")
+                continue
+            converted[column] = series.astype(dtype)
+        else:
+            converted[column] = series.astype(dtype)
+
+    if not converted:
+        return df
+    return df.assign(**converted)
+
+
+class DtypeOptimizingIngestor(DataIngestor):
+    """
+    Wraps another ingestor and shrinks its output with a compact schema. The
+    schema is inferred on the first load, written to `schema_path` as JSON and
+    reapplied unchanged on every later load so dtypes stay stable across runs.
+    """
+
+    def __init__(self, ingestor:DataIngestor, schema_path:str="ingest_schema.json", max_unique_ratio:float=0.5):
+        self.ingestor = ingestor
+        self.schema_path = schema_path
+        self.max_unique_ratio = max_unique_ratio
+
+    def cache_config(self)->dict:
+        config = super().cache_config()
+        # The schema file's content decides the output dtypes, not just its path
+        config["schema"] = None
+        if os.path.exists(self.schema_path):
+            with open(self.schema_path) as f:
+                config["schema"] = json.load(f)
+        return config
+
+    def load_schema(self, df:pd.DataFrame)->dict:
+        if os.path.exists(self.schema_path):
+            with open(self.schema_path) as f:
+                return json.load(f)
+        return self.save_schema(infer_compact_schema(df, self.max_unique_ratio))
+
+    def save_schema(self, schema:dict)->dict:
+        with open(self.schema_path, "w") as f:
+            json.dump(schema, f, indent=2)
+        logging.info(f"Inferred compact schema for {len(schema)} columns and saved it to {self.schema_path}")
+        return schema
+
+    def ingest(self, file_path:str)->pd.DataFrame:
+        df = self.ingestor.ingest(file_path)
+        before = df.memory_usage(deep=True).sum()
+        df = apply_schema(df, self.load_schema(df))
+        after = df.memory_usage(deep=True).sum()
+        logging.info(f"Memory usage reduced from {before / 2**20:.2f} MiB to {after / 2**20:.2f} MiB")
+        return df
+
+    def iter_chunks(self, file_path:str)->Iterator[pd.DataFrame]:
+        """
+        Without a saved schema this reads the file twice: one pass to infer the
+        schema from every chunk, then one to yield the converted chunks. The
+        first chunk alone can miss larger values and labels further down.
+        """
+        if os.path.exists(self.schema_path):
+            with open(self.schema_path) as f:
+                schema = json.load(f)
         else:
+            schema = self.save_schema(
+                infer_compact_schema_from_chunks(self.ingestor.iter_chunks(file_path), self.max_unique_ratio)
+            )
+        for chunk in self.ingestor.iter_chunks(file_path):
+            yield apply_schema(chunk, schema)
+
+
+class DataIngestorFactory:
+    # Longest extensions are matched first so ".csv.gz" wins over ".gz".
+    _registry = {
+        ".zip": ZipDataIngestor,
+        ".csv": CSVDataIngestor,
+        ".csv.gz": GzipCSVDataIngestor,
+        ".gz": GzipCSVDataIngestor,
+        ".parquet": ParquetDataIngestor,
+        ".feather": FeatherDataIngestor,
+        ".jsonl": JSONLDataIngestor,
+    }
+
+    # Leading bytes used to identify files whose extension is missing or unknown.
+    _magic_numbers = [
+        (b"PK\x03\x04", ".zip"),
+        (b"\x1f\x8b", ".gz"),
+        (b"PAR1", ".parquet"),
+        (b"ARROW1", ".feather"),
+        (b"{", ".jsonl"),
+    ]
+
+    @classmethod
+    def register(cls, file_extension:str, ingestor_class:type):
+        cls._registry[file_extension.lower()] = ingestor_class
+
+    @classmethod
+    def get_data_ingestor(
+        cls, file_extension: str, cache_dir:Optional[str]=None, schema_path:Optional[str]=None, **kwargs
+    ) -> DataIngestor:
+        ingestor_class = cls._registry.get(file_extension.lower())
+        if ingestor_class is None:
             raise ValueError(f"No Ingestor available for file extension {file_extension}")
+
+        ingestor = ingestor_class(**kwargs)
+        if schema_path is not None:
+            ingestor = DtypeOptimizingIngestor(ingestor, schema_path=schema_path)
+        if cache_dir is not None:
+            return CachingDataIngestor(ingestor, cache_dir=cache_dir)
+        return ingestor
+
+    @classmethod
+    def detect_extension(cls, file_path:str)->str:
+        name = os.path.basename(file_path).lower()
+        for extension in sorted(cls._registry, key=len, reverse=True):
+            if name.endswith(extension):
+                return extension
+
+        with open(file_path, "rb") as f:
+            head = f.read(8).lstrip()
+        for magic, extension in cls._magic_numbers:
+            if head.startswith(magic):
+                return extension
+        return ".csv"
+
+    @classmethod
+    def get_data_ingestor_for_path(
+        cls, file_path:str, cache_dir:Optional[str]=None, schema_path:Optional[str]=None, **kwargs
+    ) -> DataIngestor:
+        file_extension = cls.detect_extension(file_path)
+        logging.info(f"Selected ingestor for extension {file_extension} to read {file_path}")
+        return cls.get_data_ingestor(file_extension, cache_dir=cache_dir, schema_path=schema_path, **kwargs)
             
 if __name__ == "__main__":
     pass       
\ No newline at end of file
@@ -0,0 +1,84 @@
+import asyncio
+import logging
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent prediction requests into one model call. Requests are
+    queued; a batch is flushed once it holds `max_batch_size` rows or the first
+    queued request has waited `max_wait_ms`. The batch runs in a worker thread so
+    the event loop keeps accepting requests, and each caller gets back only the
+    predictions for its own rows.
+    """
+
+    def __init__(
+        self,
+        predict_batch:Callable[[pd.DataFrame], np.ndarray],
+        max_batch_size:int=256,
+        max_wait_ms:float=5.0,
+    ):
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self._queue:Optional[asyncio.Queue] = None
+        self._worker:Optional[asyncio.Task] = None
+
+    async def start(self):
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(self._run())
+        logging.info(f"Micro-batching up to {self.max_batch_size} rows or {self.max_wait * 1000:.1f} ms")
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    async def submit(self, df:pd.DataFrame)->np.ndarray:
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((df, future))
+        return await future
+
+    async def _collect(self)->List[tuple]:
+        batch = [await self._queue.get()]
+        rows = len(batch[0][0])
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while rows < self.max_batch_size:
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                break
+            try:
+                item = await asyncio.wait_for(self._queue.get(), remaining)
+            except asyncio.TimeoutError:
+                break
+            batch.append(item)
+            rows += len(item[0])
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            frames = [df for df, _ in batch]
+            try:
+                combined = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+                predictions = await asyncio.to_thread(self.predict_batch, combined)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for df, future in batch:
+                if not future.done():
+                    future.set_result(predictions[offset:offset + len(df)])
+                offset += len(df)
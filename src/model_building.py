@@ -1,12 +1,26 @@
+import copy
+import hashlib
 import logging
+import os
+import shutil
+import tempfile
 from abc import ABC, abstractmethod
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
+import joblib
+
+import numpy as np
 import pandas as pd
 from sklearn.base import RegressorMixin
-from sklearn.linear_model import LinearRegression, ElasticNet
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import HistGradientBoostingRegressor
+from sklearn.impute import SimpleImputer
+from sklearn.linear_model import LinearRegression, ElasticNet, SGDRegressor, enet_path
+from sklearn.metrics import mean_squared_error
+from sklearn.model_selection import KFold
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import StandardScaler
+from sklearn.preprocessing import OrdinalEncoder, StandardScaler
 
 # Setup logging configuration
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -65,6 +79,569 @@ class LinearRegressionStrategy(ModelBuildingStrategy):
         return pipeline
 
 
+# Training data as seen by a search worker process: memory-mapped arrays opened
+# once per process, plus the fold indices every worker derives identically.
+_search_data: Dict[str, Any] = {}
+
+
+def _init_search_worker(x_path: str, y_path: str, folds: int, seed: Optional[int]):
+    X = np.load(x_path, mmap_mode="r")
+    y = np.load(y_path, mmap_mode="r")
+    _search_data.update(X=X, y=y, splits=list(KFold(folds, shuffle=True, random_state=seed).split(X)))
+
+
+def _score_candidate(task: Tuple[int, int, float, float]) -> Tuple[int, int, float]:
+    """Fits one (candidate, fold) pair on the shared data and returns its validation MSE."""
+    candidate, fold, alpha, l1_ratio = task
+    X, y = _search_data["X"], _search_data["y"]
+    train, test = _search_data["splits"][fold]
+    pipeline = Pipeline(
+        [
+            ("scaler", StandardScaler()),
+            ("model", ElasticNet(alpha=alpha, l1_ratio=l1_ratio)),
+        ]
+    )
+    pipeline.fit(X[train], y[train])
+    return candidate, fold, mean_squared_error(y[test], pipeline.predict(X[test]))
+
+
+def _path_fold_mse(task: Tuple[int, List[float], np.ndarray]) -> Tuple[int, np.ndarray]:
+    """
+    Validation MSE along every l1_ratio's path for one fold. The scaler is fit on
+    the fold's training rows only, so the held-out rows never shape the scaling.
+    """
+    fold, l1_ratios, alphas = task
+    X, y = _search_data["X"], _search_data["y"]
+    train, test = _search_data["splits"][fold]
+    scaler = StandardScaler().fit(X[train])
+    X_fit, X_val = scaler.transform(X[train]), scaler.transform(X[test])
+    # enet_path fits no intercept; the scaled features are already centred
+    y_mean = y[train].mean()
+    y_fit = y[train] - y_mean
+    gram = X_fit.T @ X_fit if X_fit.shape[0] > X_fit.shape[1] else False
+    Xy = X_fit.T @ y_fit if gram is not False else None
+
+    mse = np.empty(alphas.shape)
+    for i, l1_ratio in enumerate(l1_ratios):
+        _, coefs, _ = enet_path(X_fit, y_fit, l1_ratio=l1_ratio, alphas=alphas[i], precompute=gram, Xy=Xy)
+        residuals = (y[test] - y_mean)[:, None] - X_val @ coefs
+        mse[i] = np.mean(residuals ** 2, axis=0)
+    return fold, mse
+
+
+# Concrete Strategy for a cross-validated ElasticNet hyperparameter search
+class ElasticNetSearchStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        alphas: Sequence[float] = (0.01, 0.1, 1.0, 10.0, 100.0),
+        l1_ratios: Sequence[float] = (0.1, 0.5, 0.9, 1.0),
+        n_iter: Optional[int] = None,
+        cv: int = 5,
+        n_jobs: Optional[int] = None,
+        seed: Optional[int] = 42,
+    ):
+        """
+        Tunes ElasticNet's alpha and l1_ratio by k-fold cross-validation. Every
+        (candidate, fold) fit is an independent task spread over a process pool.
+        The training matrix is written once to a memory-mapped .npy file that
+        each worker maps read-only, so it is shared through the page cache
+        instead of being pickled to every process.
+
+        Parameters:
+        alphas, l1_ratios: The grid. With n_iter set, n_iter candidates are drawn
+            at random instead: alpha log-uniform and l1_ratio uniform over the
+            ranges the grid spans.
+        cv (int): Number of folds.
+        n_jobs (Optional[int]): Worker processes; None uses every core, 1 runs serially in-process.
+        seed (Optional[int]): Seed for the fold shuffle and random sampling.
+        """
+        self.alphas = alphas
+        self.l1_ratios = l1_ratios
+        self.n_iter = n_iter
+        self.cv = cv
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.seed = seed
+        self.cv_results_: List[Dict[str, float]] = []
+        self.best_params_: Dict[str, float] = {}
+
+    def candidates(self) -> List[Tuple[float, float]]:
+        if self.n_iter is None:
+            return [(alpha, l1_ratio) for alpha in self.alphas for l1_ratio in self.l1_ratios]
+        rng = np.random.default_rng(self.seed)
+        log_alphas = np.log10([min(self.alphas), max(self.alphas)])
+        alphas = 10 ** rng.uniform(*log_alphas, size=self.n_iter)
+        l1_ratios = rng.uniform(min(self.l1_ratios), max(self.l1_ratios), size=self.n_iter)
+        return list(zip(alphas.tolist(), l1_ratios.tolist()))
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        """
+        Runs the search, then refits the best candidate on all of X_train.
+
+        Parameters:
+        X_train (pd.DataFrame): The training data features (numeric).
+        y_train (pd.Series): The training data labels/target.
+
+        Returns:
+        Pipeline: A scaler + ElasticNet pipeline with the best alpha and l1_ratio.
+        """
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("X_train must be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("y_train must be a pandas Series.")
+
+        candidates = self.candidates()
+        tasks = [
+            (candidate, fold, alpha, l1_ratio)
+            for candidate, (alpha, l1_ratio) in enumerate(candidates)
+            for fold in range(self.cv)
+        ]
+        logging.info(f"Searching {len(candidates)} ElasticNet candidates x {self.cv} folds on {self.n_jobs} workers.")
+
+        workdir = tempfile.mkdtemp(prefix="model_search_")
+        try:
+            x_path, y_path = os.path.join(workdir, "X.npy"), os.path.join(workdir, "y.npy")
+            np.save(x_path, X_train.to_numpy(dtype=np.float64))
+            np.save(y_path, y_train.to_numpy(dtype=np.float64))
+            init_args = (x_path, y_path, self.cv, self.seed)
+            if self.n_jobs == 1:
+                _init_search_worker(*init_args)
+                results = [_score_candidate(task) for task in tasks]
+                _search_data.clear()
+            else:
+                with ProcessPoolExecutor(self.n_jobs, initializer=_init_search_worker, initargs=init_args) as pool:
+                    results = list(pool.map(_score_candidate, tasks, chunksize=max(1, len(tasks) // (4 * self.n_jobs))))
+        finally:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+        fold_mse = np.zeros((len(candidates), self.cv))
+        for candidate, fold, mse in results:
+            fold_mse[candidate, fold] = mse
+        mean_mse = fold_mse.mean(axis=1)
+        self.cv_results_ = [
+            {"alpha": alpha, "l1_ratio": l1_ratio, "mean_mse": float(mse)}
+            for (alpha, l1_ratio), mse in zip(candidates, mean_mse)
+        ]
+        best_alpha, best_l1_ratio = candidates[int(np.argmin(mean_mse))]
+        self.best_params_ = {"alpha": best_alpha, "l1_ratio": best_l1_ratio}
+        logging.info(f"Best parameters: {self.best_params_} (CV MSE {mean_mse.min():.4g}).")
+
+        pipeline = Pipeline(
+            [
+                ("scaler", StandardScaler()),
+                ("model", ElasticNet(alpha=best_alpha, l1_ratio=best_l1_ratio)),
+            ]
+        )
+        pipeline.fit(X_train, y_train)
+        logging.info("Model training completed.")
+        return pipeline
+
+
+# Concrete Strategy fitting the whole ElasticNet regularization path per fold
+class ElasticNetPathStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        l1_ratios: Sequence[float] = (0.1, 0.5, 0.9, 1.0),
+        n_alphas: int = 100,
+        eps: float = 1e-3,
+        cv: int = 5,
+        n_jobs: Optional[int] = None,
+        seed: Optional[int] = 42,
+    ):
+        """
+        Selects alpha and l1_ratio by cross-validation over regularization paths.
+        For every fold the scaler is fit on that fold's training rows, and for
+        every l1_ratio one coordinate-descent path runs over n_alphas values,
+        from the alpha that zeroes every coefficient down to eps times that.
+        Each alpha starts from the previous solution, and the fold's Gram matrix
+        is computed once and reused by all its paths when there are more
+        samples than features.
+
+        Parameters:
+        l1_ratios (Sequence[float]): l1_ratio values, one path each; all must be > 0.
+        n_alphas (int): Length of each regularization path.
+        eps (float): Ratio of the smallest to the largest alpha on the path.
+        cv (int): Number of folds.
+        n_jobs (Optional[int]): Worker processes for the folds; None uses every core, 1 runs serially in-process.
+        seed (Optional[int]): Seed for the fold shuffle.
+        """
+        self.l1_ratios = l1_ratios
+        self.n_alphas = n_alphas
+        self.eps = eps
+        self.cv = cv
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.seed = seed
+        self.best_params_: Dict[str, float] = {}
+        self.alphas_: Optional[np.ndarray] = None
+        self.mse_path_: Optional[np.ndarray] = None
+
+    def alpha_grid(self, X: np.ndarray, y: np.ndarray) -> np.ndarray:
+        """One descending alpha path per l1_ratio, shaped (n_l1_ratios, n_alphas)."""
+        X = StandardScaler().fit_transform(X)
+        correlation = np.max(np.abs(X.T @ (y - y.mean()))) / len(y)
+        return np.array([
+            np.geomspace(correlation / l1_ratio, correlation / l1_ratio * self.eps, self.n_alphas)
+            for l1_ratio in self.l1_ratios
+        ])
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        """
+        Runs the cross-validated path search and refits at the selected point.
+
+        Parameters:
+        X_train (pd.DataFrame): The training data features (numeric).
+        y_train (pd.Series): The training data labels/target.
+
+        Returns:
+        Pipeline: A scaler + ElasticNet pipeline at the selected alpha and l1_ratio.
+        """
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("X_train must be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("y_train must be a pandas Series.")
+
+        logging.info(f"Fitting {len(self.l1_ratios)} ElasticNet paths of {self.n_alphas} alphas x {self.cv} folds.")
+        X = X_train.to_numpy(dtype=np.float64)
+        y = y_train.to_numpy(dtype=np.float64)
+        alphas = self.alpha_grid(X, y)
+        tasks = [(fold, list(self.l1_ratios), alphas) for fold in range(self.cv)]
+
+        if self.n_jobs == 1:
+            _search_data.update(X=X, y=y, splits=list(KFold(self.cv, shuffle=True, random_state=self.seed).split(X)))
+            try:
+                results = [_path_fold_mse(task) for task in tasks]
+            finally:
+                _search_data.clear()
+        else:
+            workdir = tempfile.mkdtemp(prefix="model_search_")
+            try:
+                x_path, y_path = os.path.join(workdir, "X.npy"), os.path.join(workdir, "y.npy")
+                np.save(x_path, X)
+                np.save(y_path, y)
+                init_args = (x_path, y_path, self.cv, self.seed)
+                # One task per fold, so more workers than folds would sit idle
+                workers = min(self.n_jobs, len(tasks))
+                with ProcessPoolExecutor(workers, initializer=_init_search_worker, initargs=init_args) as pool:
+                    results = list(pool.map(_path_fold_mse, tasks))
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+
+        # Same layout as ElasticNetCV: (n_l1_ratios, n_alphas, n_folds)
+        mse_path = np.zeros((len(self.l1_ratios), self.n_alphas, self.cv))
+        for fold, mse in results:
+            mse_path[:, :, fold] = mse
+        i, j = np.unravel_index(np.argmin(mse_path.mean(axis=2)), alphas.shape)
+        self.best_params_ = {"alpha": float(alphas[i, j]), "l1_ratio": float(self.l1_ratios[i])}
+        self.alphas_ = alphas
+        self.mse_path_ = mse_path
+        logging.info(f"Best parameters: {self.best_params_}.")
+
+        # Same shape as LinearRegressionStrategy: a plain ElasticNet after the scaler.
+        # One more fit at a single alpha is negligible next to the paths.
+        pipeline = Pipeline(
+            [
+                ("scaler", StandardScaler()),
+                ("model", ElasticNet(**self.best_params_, precompute=True)),
+            ]
+        )
+        pipeline.fit(X_train, y_train)
+
+        logging.info("Model training completed.")
+        return pipeline
+
+
+# Concrete Strategy for histogram-based gradient boosting
+class HistGradientBoostingStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        learning_rate: float = 0.1,
+        max_iter: int = 1000,
+        max_leaf_nodes: int = 31,
+        l2_regularization: float = 0.0,
+        validation_fraction: float = 0.1,
+        n_iter_no_change: int = 20,
+        seed: Optional[int] = 42,
+    ):
+        """
+        Gradient-boosted trees on features binned once into at most 255 bins.
+        Categorical columns are ordinal-coded and split on natively by category
+        set, so no one-hot expansion is needed; missing values, in numeric or
+        categorical columns, get their own branch. Training is multi-threaded
+        through OpenMP and stops once the loss on a held-out validation_fraction
+        of the rows has not improved for n_iter_no_change iterations.
+
+        Parameters:
+        learning_rate, max_iter, max_leaf_nodes, l2_regularization: Passed to HistGradientBoostingRegressor.
+        validation_fraction (float): Share of the training rows held out for early stopping.
+        n_iter_no_change (int): Patience of the early stopping.
+        seed (Optional[int]): Seed for the validation split.
+        """
+        self.learning_rate = learning_rate
+        self.max_iter = max_iter
+        self.max_leaf_nodes = max_leaf_nodes
+        self.l2_regularization = l2_regularization
+        self.validation_fraction = validation_fraction
+        self.n_iter_no_change = n_iter_no_change
+        self.seed = seed
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        """
+        Builds and trains the gradient-boosting pipeline.
+
+        Parameters:
+        X_train (pd.DataFrame): The training data features, categorical columns as object or category dtype.
+        y_train (pd.Series): The training data labels/target.
+
+        Returns:
+        Pipeline: An ordinal encoder for the categoricals followed by the boosted trees.
+        """
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("X_train must be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("y_train must be a pandas Series.")
+
+        categorical_cols = X_train.select_dtypes(include=["object", "category"]).columns
+        numerical_cols = X_train.select_dtypes(exclude=["object", "category"]).columns
+        logging.info(f"Initializing gradient boosting with {len(categorical_cols)} native categorical features.")
+
+        # Categories unseen in training and missing values both become NaN, which the trees route as missing
+        encoder = OrdinalEncoder(
+            handle_unknown="use_encoded_value",
+            unknown_value=np.nan,
+            encoded_missing_value=np.nan,
+        )
+        preprocessor = ColumnTransformer(
+            transformers=[
+                ("cat", encoder, categorical_cols),
+                ("num", "passthrough", numerical_cols),
+            ]
+        )
+        model = HistGradientBoostingRegressor(
+            learning_rate=self.learning_rate,
+            max_iter=self.max_iter,
+            max_leaf_nodes=self.max_leaf_nodes,
+            l2_regularization=self.l2_regularization,
+            categorical_features=[True] * len(categorical_cols) + [False] * len(numerical_cols),
+            early_stopping=True,
+            validation_fraction=self.validation_fraction,
+            n_iter_no_change=self.n_iter_no_change,
+            random_state=self.seed,
+        )
+        pipeline = Pipeline([("preprocessor", preprocessor), ("model", model)])
+
+        logging.info("Training gradient boosting model.")
+        pipeline.fit(X_train, y_train)
+        logging.info(f"Model training completed after {model.n_iter_} iterations.")
+        return pipeline
+
+
+# Concrete Strategy for out-of-core training with SGD over chunked data
+class IncrementalSGDStrategy(ModelBuildingStrategy):
+    def __init__(
+        self,
+        target: str = "SalePrice",
+        features: Optional[Sequence[str]] = None,
+        epochs: int = 5,
+        chunksize: int = 50_000,
+        checkpoint_dir: Optional[str] = None,
+        alpha: float = 1e-4,
+        l1_ratio: float = 0.15,
+        eta0: float = 0.01,
+        seed: Optional[int] = 42,
+    ):
+        """
+        Trains a linear model on data that never has to be in memory at once.
+        One pass over the chunks accumulates the feature scaler's running
+        mean/variance and the target's mean/std. Each epoch then streams the
+        chunks again through SGDRegressor.partial_fit on standardized features
+        and target. Memory use is bounded by the chunk size, not the data size.
+
+        Parameters:
+        target (str): Target column in each chunk.
+        features (Optional[Sequence[str]]): Feature columns; defaults to every numeric column but the target.
+        epochs (int): Passes over the data.
+        chunksize (int): Rows per chunk when training from in-memory frames.
+        checkpoint_dir (Optional[str]): Where the state is saved after every epoch.
+            An interrupted run resumes from the checkpoint found there if it was
+            written with the same settings and data; it is deleted once training finishes.
+        alpha, l1_ratio, eta0: Passed to SGDRegressor (elastic-net penalty).
+        seed (Optional[int]): Seed for SGD and the within-chunk shuffle.
+        """
+        self.target = target
+        self.features = list(features) if features is not None else None
+        self.epochs = epochs
+        self.chunksize = chunksize
+        self.checkpoint_dir = checkpoint_dir
+        self.alpha = alpha
+        self.l1_ratio = l1_ratio
+        self.eta0 = eta0
+        self.seed = seed
+
+    def build_and_train_model(self, X_train: pd.DataFrame, y_train: pd.Series) -> Pipeline:
+        """
+        Trains on in-memory frames by streaming them in chunks of `chunksize` rows.
+
+        Parameters:
+        X_train (pd.DataFrame): The training data features.
+        y_train (pd.Series): The training data labels/target.
+
+        Returns:
+        Pipeline: scaler, missing-value fill and the SGD model.
+        """
+        if not isinstance(X_train, pd.DataFrame):
+            raise TypeError("X_train must be a pandas DataFrame.")
+        if not isinstance(y_train, pd.Series):
+            raise TypeError("y_train must be a pandas Series.")
+
+        def chunk_source():
+            for start in range(0, len(X_train), self.chunksize):
+                stop = start + self.chunksize
+                yield X_train.iloc[start:stop].assign(**{self.target: y_train.iloc[start:stop].to_numpy()})
+
+        return self.train_on_chunks(chunk_source)
+
+    def train_on_chunks(self, chunk_source: Callable[[], Iterable[pd.DataFrame]]) -> Pipeline:
+        """
+        Trains out of core. `chunk_source` is a callable returning a fresh iterator
+        of DataFrame chunks holding the features and the target, e.g.
+        `lambda: ingestor.iter_chunks(file_path)`; it is called once per epoch
+        plus once for the statistics pass.
+
+        Returns:
+        Pipeline: scaler, missing-value fill and the SGD model, predicting in target units.
+        """
+        fingerprint = self._fingerprint(chunk_source) if self.checkpoint_dir else None
+        state = self._load_checkpoint(fingerprint)
+        if state is None:
+            state = self._fit_statistics(chunk_source)
+            state["fingerprint"] = fingerprint
+        elif state["epoch"] > 0:
+            logging.info(f"Resuming incremental training after epoch {state['epoch']}.")
+
+        model = state["model"]
+        rng = np.random.default_rng(self.seed)
+        for epoch in range(state["epoch"] + 1, self.epochs + 1):
+            squared_error, scored, rows = 0.0, 0, 0
+            for chunk in chunk_source():
+                chunk = chunk.dropna(subset=[self.target])
+                if chunk.empty:
+                    continue
+                X, y = self._scaled(chunk, state)
+                if hasattr(model, "coef_"):
+                    # Progressive validation: score each chunk before learning from it
+                    squared_error += float(np.sum((model.predict(X) - y) ** 2))
+                    scored += len(y)
+                order = rng.permutation(len(y))
+                model.partial_fit(X[order], y[order])
+                rows += len(y)
+            state["epoch"] = epoch
+            rmse = np.sqrt(squared_error / scored) * state["y_std"] if scored else float("nan")
+            logging.info(f"Epoch {epoch}/{self.epochs}: {rows} rows, progressive RMSE {rmse:.4g}.")
+            self._save_checkpoint(state)
+
+        pipeline = self._export(state)
+        self._remove_checkpoint()
+        return pipeline
+
+    def _fit_statistics(self, chunk_source: Callable[[], Iterable[pd.DataFrame]]) -> Dict[str, Any]:
+        scaler = StandardScaler()
+        count, y_sum, y_sum_sq = 0, 0.0, 0.0
+        for chunk in chunk_source():
+            chunk = chunk.dropna(subset=[self.target])
+            if chunk.empty:
+                continue
+            if self.features is None:
+                self.features = chunk.select_dtypes(include="number").columns.drop(self.target).tolist()
+            # partial_fit ignores NaNs, so missing values do not bias the running statistics
+            scaler.partial_fit(chunk[self.features])
+            y = chunk[self.target].to_numpy(dtype=np.float64)
+            count += len(y)
+            y_sum += float(y.sum())
+            y_sum_sq += float(np.dot(y, y))
+        if count == 0:
+            raise ValueError("No chunk contained a labelled row.")
+
+        y_mean = y_sum / count
+        y_std = np.sqrt(max(y_sum_sq / count - y_mean ** 2, 0.0)) or 1.0
+        logging.info(f"Scaler statistics from {count} rows over {len(self.features)} features.")
+        model = SGDRegressor(
+            penalty="elasticnet",
+            alpha=self.alpha,
+            l1_ratio=self.l1_ratio,
+            learning_rate="invscaling",
+            eta0=self.eta0,
+            random_state=self.seed,
+        )
+        return {"epoch": 0, "features": self.features, "scaler": scaler, "model": model, "y_mean": y_mean, "y_std": y_std}
+
+    def _scaled(self, chunk: pd.DataFrame, state: Dict[str, Any]) -> Tuple[np.ndarray, np.ndarray]:
+        X = state["scaler"].transform(chunk[state["features"]])
+        # A missing value becomes the running mean, i.e. 0 after scaling
+        np.nan_to_num(X, copy=False, nan=0.0)
+        y = (chunk[self.target].to_numpy(dtype=np.float64) - state["y_mean"]) / state["y_std"]
+        return X, y
+
+    def _export(self, state: Dict[str, Any]) -> Pipeline:
+        # Work on a copy so the state, and a checkpoint saved from it, keep the standardized weights
+        model = copy.deepcopy(state["model"])
+        # Fold the target standardization into the weights so the model predicts prices directly
+        model.coef_ = model.coef_ * state["y_std"]
+        model.intercept_ = model.intercept_ * state["y_std"] + state["y_mean"]
+        # A constant fill needs no statistics; fitting on one row only sets the width
+        imputer = SimpleImputer(strategy="constant", fill_value=0.0).fit(np.zeros((1, len(state["features"]))))
+        logging.info("Model training completed.")
+        return Pipeline([("scaler", state["scaler"]), ("imputer", imputer), ("model", model)])
+
+    def _checkpoint_path(self) -> Optional[str]:
+        return os.path.join(self.checkpoint_dir, "incremental_sgd.joblib") if self.checkpoint_dir else None
+
+    def _fingerprint(self, chunk_source: Callable[[], Iterable[pd.DataFrame]]) -> str:
+        """
+        Hash of the settings that shape training and of the first chunk of data.
+        Only a checkpoint with the same fingerprint is resumed; reading one chunk
+        is cheap next to a full pass and catches a different file or target.
+        """
+        digest = hashlib.sha256(repr(
+            (self.target, self.features, self.chunksize, self.alpha, self.l1_ratio, self.eta0, self.seed)
+        ).encode())
+        chunks = iter(chunk_source())
+        try:
+            first = next(chunks, None)
+        finally:
+            # Releases the file a reader generator holds open
+            getattr(chunks, "close", lambda: None)()
+        if first is not None:
+            digest.update(repr(list(first.columns)).encode())
+            digest.update(pd.util.hash_pandas_object(first, index=False).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def _load_checkpoint(self, fingerprint: Optional[str]) -> Optional[Dict[str, Any]]:
+        path = self._checkpoint_path()
+        if path is None or not os.path.exists(path):
+            return None
+        state = joblib.load(path)
+        if state.get("fingerprint") != fingerprint:
+            logging.warning(f"Ignoring checkpoint {path}: it was written for different settings or data.")
+            return None
+        self.features = state["features"]
+        return state
+
+    def _remove_checkpoint(self):
+        path = self._checkpoint_path()
+        if path is not None and os.path.exists(path):
+            os.remove(path)
+            logging.info(f"Training finished; removed checkpoint {path}")
+
+    def _save_checkpoint(self, state: Dict[str, Any]):
+        path = self._checkpoint_path()
+        if path is None:
+            return
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        # Write then rename, so an interrupted save never leaves a truncated checkpoint
+        joblib.dump(state, path + ".tmp")
+        os.replace(path + ".tmp", path)
+        logging.info(f"Checkpoint saved after epoch {state['epoch']}: {path}")
+
+
 # Context Class for Model Building
 class ModelBuilder:
     def __init__(self, strategy: ModelBuildingStrategy):
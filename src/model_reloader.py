@@ -0,0 +1,121 @@
+import glob
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+def model_version(model_dir:str) -> Tuple[str, float]:
+    """
+    A model directory is identified by its path and the mtime of its MLmodel file.
+    Anything that is not a local directory (e.g. a runs:/ URI) only changes with its path.
+    """
+    mlmodel = os.path.join(model_dir, "MLmodel")
+    if os.path.exists(mlmodel):
+        return (os.path.abspath(model_dir), os.path.getmtime(mlmodel))
+    return (model_dir, 0.0)
+
+
+def latest_model_dir(pattern:str) -> Optional[str]:
+    """Most recently written model directory whose MLmodel file matches the glob pattern."""
+    matches = glob.glob(pattern, recursive=True)
+    if not matches:
+        return None
+    return os.path.dirname(max(matches, key=os.path.getmtime))
+
+
+class ModelReloader:
+    """
+    Holds the model being served and replaces it without downtime. A background
+    thread polls the artifact location; when a new version shows up it is loaded
+    and warmed up off the request path, then swapped in with a single reference
+    assignment. Requests read `model` once and keep that reference, so anything
+    in flight during a swap finishes on the old model.
+    """
+
+    def __init__(
+        self,
+        load_model:Callable[[str], Any],
+        locate:Callable[[], Optional[str]],
+        warmup:Optional[Callable[[Any], None]]=None,
+        poll_interval:float=5.0,
+    ):
+        self.load_model = load_model
+        self.locate = locate
+        self.warmup = warmup
+        self.poll_interval = poll_interval
+        self.model = None
+        self.version:Optional[Tuple[str, float]] = None
+        self.last_reload:Dict[str, float] = {}
+        self.reload_count = 0
+        self._reload_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread:Optional[threading.Thread] = None
+
+    def check(self) -> bool:
+        """Load, warm up and swap in the located model if it differs from the one served."""
+        with self._reload_lock:
+            model_dir = self.locate()
+            if model_dir is None:
+                return False
+            version = model_version(model_dir)
+            if version == self.version:
+                return False
+
+            logging.info(f"Loading model from: {model_dir}")
+            start = time.perf_counter()
+            model = self.load_model(model_dir)
+            loaded = time.perf_counter()
+            if self.warmup is not None:
+                self.warmup(model)
+            warmed = time.perf_counter()
+            replaced = self.model is not None
+            self.model, self.version = model, version
+            swapped = time.perf_counter()
+
+            # The first load is not a reload
+            if replaced:
+                self.reload_count += 1
+            self.last_reload = {
+                "load_seconds": loaded - start,
+                "warmup_seconds": warmed - loaded,
+                "swap_seconds": swapped - warmed,
+                "completed_at": time.time(),
+            }
+            logging.info(
+                f"Serving model {model_dir} (load {loaded - start:.2f}s, "
+                f"warm-up {warmed - loaded:.2f}s, swap {(swapped - warmed) * 1e6:.1f}us)"
+            )
+            return True
+
+    def _watch(self):
+        while not self._stop.wait(self.poll_interval):
+            try:
+                self.check()
+            except Exception as e:
+                # Keep serving the current model; the next poll retries
+                logging.error(f"Model reload failed: {e}")
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._watch, name="model-reloader", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def status(self) -> Dict[str, Any]:
+        return {
+            "model_path": self.version[0] if self.version else None,
+            "model_mtime": self.version[1] if self.version else None,
+            "reload_count": self.reload_count,
+            "last_reload": self.last_reload,
+            "watching": self._thread is not None and self._thread.is_alive(),
+        }
@@ -1,5 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
+from functools import partial
 
 import matplotlib.pyplot as plt
 import numpy as np
@@ -9,33 +10,265 @@ import seaborn as sns
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
 
+class ExactQuantileEstimator:
+    """Keeps every value as a compact float64 block and answers all quantiles with one sort."""
+
+    def __init__(self):
+        self._blocks = []
+        self._cache = {}
+
+    def update(self, values:np.ndarray):
+        self._blocks.append(values)
+        self._cache = {}
+
+    def merge(self, other:"ExactQuantileEstimator"):
+        self._blocks.extend(other._blocks)
+        self._cache = {}
+
+    def quantiles(self, probabilities)->np.ndarray:
+        key = tuple(probabilities)
+        if key not in self._cache:
+            values = np.concatenate(self._blocks) if len(self._blocks) > 1 else self._blocks[0]
+            self._cache[key] = np.nanquantile(values, list(probabilities), axis=0)
+        return self._cache[key]
+
+
+class KLLSketch:
+    """
+    Mergeable KLL quantile sketch of one column (Karnin, Lang & Liberty, 2016).
+    Values enter level 0; a full level is sorted and every other value, starting
+    at a random offset, moves up a level with twice the weight. The normalized
+    rank error shrinks roughly as 1/k while memory stays O(k).
+    """
+
+    def __init__(self, k:int=200, seed=None):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level:int)->int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values:np.ndarray):
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self._compress()
+
+    def merge(self, other:"KLLSketch"):
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, values in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd leftover stays behind so total weight is preserved exactly.
+                keep = items[:1] if len(items) % 2 else items[:0]
+                pairs = items[len(keep):]
+                promoted = pairs[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def quantiles(self, probabilities)->np.ndarray:
+        items = np.concatenate(self.levels)
+        if len(items) == 0:
+            return np.full(len(probabilities), np.nan)
+        weights = np.concatenate([np.full(len(values), 2.0 ** level) for level, values in enumerate(self.levels)])
+        order = np.argsort(items)
+        items, cumulative = items[order], np.cumsum(weights[order])
+        ranks = np.asarray(probabilities) * cumulative[-1]
+        positions = np.minimum(np.searchsorted(cumulative, ranks, side="left"), len(items) - 1)
+        return items[positions]
+
+
+class KLLQuantileEstimator:
+    """Approximate, bounded-memory drop-in for ExactQuantileEstimator with one KLLSketch per column."""
+
+    def __init__(self, k:int=200, seed=None):
+        self.k = k
+        self.seed = seed
+        self.sketches = None
+
+    def update(self, values:np.ndarray):
+        if self.sketches is None:
+            self.sketches = [KLLSketch(self.k, self.seed) for _ in range(values.shape[1])]
+        for column, sketch in enumerate(self.sketches):
+            sketch.update(values[:, column])
+
+    def merge(self, other:"KLLQuantileEstimator"):
+        if self.sketches is None:
+            self.sketches = other.sketches
+            return
+        for sketch, other_sketch in zip(self.sketches, other.sketches):
+            sketch.merge(other_sketch)
+
+    def quantiles(self, probabilities)->np.ndarray:
+        return np.column_stack([sketch.quantiles(probabilities) for sketch in self.sketches])
+
+
+class OutlierStatistics:
+    """
+    Per-column count, mean, variance and quantiles gathered in a single pass.
+    Chunks are folded in with update() and partial results from other workers
+    with merge(), using Chan et al.'s pairwise update for mean and variance.
+    With quantile_estimator_factory=None no quantiles are tracked, so memory
+    stays O(columns) no matter how many chunks are folded in.
+    """
+
+    def __init__(self, quantile_estimator_factory=ExactQuantileEstimator):
+        self.columns = None
+        self.count = None
+        self._mean = None
+        self._m2 = None
+        self.quantile_estimator_factory = quantile_estimator_factory
+        self.quantile_estimator = None
+
+    @classmethod
+    def from_frame(cls, df:pd.DataFrame, **kwargs)->"OutlierStatistics":
+        return cls(**kwargs).update(df)
+
+    @classmethod
+    def from_chunks(cls, chunks, **kwargs)->"OutlierStatistics":
+        stats = cls(**kwargs)
+        for chunk in chunks:
+            stats.update(chunk)
+        return stats
+
+    def update(self, df:pd.DataFrame)->"OutlierStatistics":
+        numeric = df.select_dtypes(include=["number"])
+        values = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.nansum(values, axis=0) / count
+            m2 = np.nansum((values - mean) ** 2, axis=0)
+
+        chunk = OutlierStatistics(self.quantile_estimator_factory)
+        chunk.columns = numeric.columns
+        chunk.count, chunk._mean, chunk._m2 = count, np.nan_to_num(mean), m2
+        if self.quantile_estimator_factory is not None:
+            chunk.quantile_estimator = self.quantile_estimator_factory()
+            chunk.quantile_estimator.update(values)
+        return self.merge(chunk)
+
+    def merge(self, other:"OutlierStatistics")->"OutlierStatistics":
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.columns = other.columns
+            self.count, self._mean, self._m2 = other.count, other._mean, other._m2
+            self.quantile_estimator = other.quantile_estimator
+            return self
+        if not self.columns.equals(other.columns):
+            raise ValueError("Cannot merge statistics computed over different columns.")
+
+        total = self.count + other.count
+        with np.errstate(invalid="ignore", divide="ignore"):
+            delta = other._mean - self._mean
+            weight = np.where(total > 0, other.count / total, 0.0)
+            self._mean = self._mean + delta * weight
+            self._m2 = self._m2 + other._m2 + delta ** 2 * self.count * weight
+        self.count = total
+        if self.quantile_estimator is not None:
+            self.quantile_estimator.merge(other.quantile_estimator)
+        return self
+
+    @property
+    def mean(self)->pd.Series:
+        return pd.Series(np.where(self.count > 0, self._mean, np.nan), index=self.columns)
+
+    @property
+    def std(self)->pd.Series:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            variance = np.where(self.count > 1, self._m2 / (self.count - 1), np.nan)
+        return pd.Series(np.sqrt(variance), index=self.columns)
+
+    def quantiles(self, probabilities)->list:
+        """One pd.Series per probability, all answered from the same estimator pass."""
+        if self.quantile_estimator is None:
+            raise ValueError("These statistics were gathered without a quantile estimator.")
+        values = self.quantile_estimator.quantiles(probabilities)
+        return [pd.Series(row, index=self.columns) for row in values]
+
+
 class OutlierDetectionStrategy(ABC):
+    # Whether column_bounds reads quantiles; capping needs them regardless.
+    needs_quantiles = False
+    # Quantile estimator to use when quantiles are needed. None picks exact
+    # quantiles for an in-memory frame and bounded KLL sketches for chunked data.
+    quantile_estimator_factory = None
+
+    def statistics(self, method:str="remove", streaming:bool=False)->"OutlierStatistics":
+        if not (self.needs_quantiles or method == "cap"):
+            factory = None
+        elif self.quantile_estimator_factory is not None:
+            factory = self.quantile_estimator_factory
+        else:
+            factory = KLLQuantileEstimator if streaming else ExactQuantileEstimator
+        return OutlierStatistics(quantile_estimator_factory=factory)
+
     @abstractmethod
-    def detect_outliers(self, df:pd.DataFrame)->pd.DataFrame:
+    def column_bounds(self, stats:OutlierStatistics):
+        """Returns (lower, upper) Series; values strictly outside them are outliers."""
         pass
+
+    def outlier_mask(self, df:pd.DataFrame, stats:OutlierStatistics)->np.ndarray:
+        """Boolean row mask, True where any column is an outlier, built one column at a time."""
+        lower, upper = self.column_bounds(stats)
+        mask = np.zeros(len(df), dtype=bool)
+        for column in stats.columns:
+            values = df[column].to_numpy(dtype=np.float64, na_value=np.nan)
+            with np.errstate(invalid="ignore"):
+                mask |= (values < lower[column]) | (values > upper[column])
+        return mask
+
+    def detect_outliers(self, df:pd.DataFrame)->pd.DataFrame:
+        lower, upper = self.column_bounds(self.statistics().update(df))
+        return (df < lower) | (df > upper)
     
     
 class ZSCoreOutlierDetection(OutlierDetectionStrategy):
     def __init__(self, threshold=3):
         self.threshold = threshold
         
-    def detect_outliers(self, df:pd.DataFrame)->pd.DataFrame:
-        logging.info("Detecting Outliers using Z-score method")
-        z_scores = np.abs((df - df.mean()) / df.std())
-        outliers = z_scores > self.threshold
-        logging.info(f"Outliers detected with Z-scores threshold: {self.threshold}.")
-        return outliers
+    def column_bounds(self, stats:OutlierStatistics):
+        logging.info(f"Detecting Outliers using Z-score method with threshold: {self.threshold}.")
+        # |x - mean| / std > threshold, rearranged so no z-score frame is needed.
+        spread = self.threshold * stats.std
+        return stats.mean - spread, stats.mean + spread
     
     
 class IQROutlierDetection(OutlierDetectionStrategy):
-    def detect_outliers(self , df:pd.DataFrame) -> pd.DataFrame:
+    needs_quantiles = True
+
+    def __init__(self, approximate=None, k=200, seed=None):
+        """
+        approximate=True estimates Q1/Q3 with KLL sketches of size k instead of
+        sorting every column, so memory no longer grows with the data;
+        approximate=False always keeps every value for exact quantiles. The
+        default None is exact for in-memory frames and approximate for chunks.
+        """
+        self.approximate = approximate
+        if approximate:
+            self.quantile_estimator_factory = partial(KLLQuantileEstimator, k, seed)
+        elif approximate is not None:
+            self.quantile_estimator_factory = ExactQuantileEstimator
+        
+    def column_bounds(self, stats:OutlierStatistics):
         logging.info("Detecting outliers using IQR method.")
-        Q1 = df.quantile(0.25)
-        Q3 = df.quantile(0.75)
+        Q1, Q3 = stats.quantiles([0.25, 0.75])
         IQR = Q3 - Q1
-        outliers = (df < (Q1 - 1.5 * IQR)) | (df > (Q3 + 1.5 * IQR))
-        logging.info("Outlier detected using the IQR mothod.")
-        return outliers
+        return Q1 - 1.5 * IQR, Q3 + 1.5 * IQR
     
     
 class OutlierDetectorr:
@@ -50,21 +283,44 @@ class OutlierDetectorr:
         logging.info("Applying feature OutlierDetection strategy.")
         return self._strategy.detect_outliers(df)
     
-    def handle_outliers(self, df:pd.DataFrame, method="remove", **kwargs) -> pd.DataFrame:
-        outliers = self.detect_outliers(df)
-        if method == "remove":
-            logging.info("Removing outliers in the dataset")
-            df_cleaned = df[(~outliers).all(axis=1)]
-        elif method == "cap":
-            logging.info("Capping outliers in the dataset")
-            df_cleaned = df.clip(lower=df.quantile(0.01), upper=df.quantile(0.99), axis=1)
-        else:
+    def handle_outliers(self, df:pd.DataFrame, method="remove", stats:OutlierStatistics=None, **kwargs) -> pd.DataFrame:
+        if method not in ("remove", "cap"):
             logging.warning(f"Unknown method '{method}'. No outlier handling performed.")
             return df
         
+        if stats is None:
+            stats = self._strategy.statistics(method).update(df)
+        df_cleaned = self._handle_with_stats(df, method, stats)
         logging.info("Outlier handling completed.")
         return df_cleaned
     
+    def iter_handle_outliers(self, chunk_source, method="remove"):
+        """
+        Handles outliers in data that does not fit in memory. `chunk_source` is a
+        callable returning a fresh iterator of DataFrame chunks: the first pass
+        gathers statistics, the second yields the cleaned chunks.
+        """
+        if method not in ("remove", "cap"):
+            logging.warning(f"Unknown method '{method}'. No outlier handling performed.")
+            yield from chunk_source()
+            return
+        
+        stats = self._strategy.statistics(method, streaming=True)
+        for chunk in chunk_source():
+            stats.update(chunk)
+        for chunk in chunk_source():
+            yield self._handle_with_stats(chunk, method, stats)
+        logging.info("Outlier handling completed.")
+    
+    def _handle_with_stats(self, df:pd.DataFrame, method:str, stats:OutlierStatistics)->pd.DataFrame:
+        if method == "remove":
+            logging.info("Removing outliers in the dataset")
+            return df[~self._strategy.outlier_mask(df, stats)]
+        
+        logging.info("Capping outliers in the dataset")
+        lower, upper = stats.quantiles([0.01, 0.99])
+        return df.clip(lower=lower, upper=upper, axis=1)
+    
     
     def visualize_outliers(self, df:pd.DataFrame, features:list):
         logging.info(f"Visualizing outliers for features:{features}")
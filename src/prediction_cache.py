@@ -0,0 +1,136 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from itertools import repeat
+from typing import Callable, Dict, Hashable, Optional
+
+import numpy as np
+import pandas as pd
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+
+# Stands in for an absent entry so a whole batch of lookups converts to one float array
+_ABSENT = (np.nan, np.nan)
+
+
+def row_keys(df:pd.DataFrame) -> np.ndarray:
+    """One 64-bit hash per preprocessed row, computed column-wise without a Python loop."""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+
+class PredictionCache:
+    """
+    In-process LRU cache with a TTL in front of model.predict. Keys are hashes of
+    preprocessed feature rows, so two payloads that differ only in ways the
+    preprocessing erases (column order, filled-in missing values) share an entry.
+    Only the rows that miss are sent to the model. The cache is tied to the model
+    it was filled from and empties itself as soon as a different model is used.
+    `on_model_call`, if given, receives the row count of every model.predict call.
+    """
+
+    def __init__(
+        self,
+        max_entries:int=100_000,
+        ttl_seconds:float=3600.0,
+        clock:Callable[[], float]=time.monotonic,
+        on_model_call:Optional[Callable[[int], None]]=None,
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.clock = clock
+        self.on_model_call = on_model_call
+        self._entries:"OrderedDict[int, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._model_key:Hashable = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def model_key(model) -> Hashable:
+        metadata = getattr(model, "metadata", None)
+        return (id(model), getattr(metadata, "model_uuid", None), getattr(metadata, "run_id", None))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _bind(self, model):
+        key = self.model_key(model)
+        if key != self._model_key:
+            if self._model_key is not None:
+                self.invalidations += 1
+                logging.info(f"Model changed, dropping {len(self._entries)} cached predictions")
+            self._entries.clear()
+            self._model_key = key
+
+    def predict(self, model, df:pd.DataFrame) -> np.ndarray:
+        """Predictions for every row of df, calling the model only for cache misses."""
+        if self.max_entries <= 0 or len(df) == 0:
+            return self._model_predict(model, df)
+
+        # Hashing and the hit/expiry bookkeeping run outside the lock; it only
+        # guards the dict lookups and updates themselves
+        keys = row_keys(df)
+        now = self.clock()
+        with self._lock:
+            self._bind(model)
+            entries = list(map(self._entries.get, keys.tolist(), repeat(_ABSENT)))
+        table = np.array(entries, dtype=np.float64).reshape(len(df), 2)
+        present = ~np.isnan(table[:, 0])
+        expired = present & (table[:, 0] <= now)
+        missed = ~present | expired
+        predictions = table[:, 1]
+        n_missed = int(missed.sum())
+
+        with self._lock:
+            for key in keys[expired].tolist():
+                entry = self._entries.get(key)
+                # Another request may have refreshed it since the lookup
+                if entry is not None and entry[0] <= now:
+                    del self._entries[key]
+                    self.expirations += 1
+            for key in keys[~missed].tolist():
+                if key in self._entries:
+                    self._entries.move_to_end(key)
+            self.hits += len(df) - n_missed
+            self.misses += n_missed
+
+        if n_missed:
+            fresh = self._model_predict(model, df[missed] if n_missed < len(df) else df).ravel()
+            predictions[missed] = fresh
+            expires_at = self.clock() + self.ttl_seconds
+            with self._lock:
+                # A concurrent request may have swapped the model in the meantime
+                if self._model_key == self.model_key(model):
+                    for key, value in zip(keys[missed].tolist(), fresh.tolist()):
+                        self._entries[key] = (expires_at, value)
+                        self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+                        self.evictions += 1
+        return predictions
+
+    def _model_predict(self, model, df:pd.DataFrame) -> np.ndarray:
+        if self.on_model_call is not None:
+            self.on_model_call(len(df))
+        return np.asarray(model.predict(df), dtype=np.float64)
+
+    def metrics(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
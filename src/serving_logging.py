@@ -0,0 +1,109 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from typing import IO, Optional
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Attributes every LogRecord has; anything else was passed through `extra=`
+_RECORD_ATTRIBUTES = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line: time, level, logger, message and any `extra=` fields."""
+
+    def format(self, record:logging.LogRecord) -> str:
+        entry = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({k: v for k, v in vars(record).items() if k not in _RECORD_ATTRIBUTES})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Keeps a random `rate` fraction of DEBUG records, the per-request detail, and
+    every record at INFO and above. Sampling happens before the record is
+    queued, so dropped records cost one random() call.
+    """
+
+    def __init__(self, rate:float=1.0):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record:logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.rate >= 1.0 or random.random() < self.rate
+
+
+class ServingLogger:
+    """
+    Structured logger for the prediction servers. With `queued` on, the request
+    path only puts records on an in-memory queue; a QueueListener thread does the
+    formatting and the blocking write, so slow stdout never adds to latency.
+    """
+
+    def __init__(self, name:str="house_price.server"):
+        self.logger = logging.getLogger(name)
+        # Keep records off the root handler that basicConfig installs in src modules
+        self.logger.propagate = False
+        self._listener:Optional[logging.handlers.QueueListener] = None
+        self._options:dict = {}
+        atexit.register(self.stop)
+
+    def configure(
+        self, level:str="INFO", sample_rate:float=1.0, queued:bool=True, stream:IO=None, capture_root:bool=False,
+    ):
+        """
+        capture_root=True also replaces the root logger's handlers with this one,
+        so the src modules' logging calls (the basicConfig stream handler) go
+        through the same queue and sampling instead of writing synchronously.
+        """
+        self.stop()
+        self._options = dict(level=level, sample_rate=sample_rate, queued=queued, stream=stream, capture_root=capture_root)
+        for handler in list(self.logger.handlers):
+            self.logger.removeHandler(handler)
+
+        output = logging.StreamHandler(stream or sys.stdout)
+        output.setFormatter(JsonFormatter())
+        if queued:
+            records = queue.SimpleQueue()
+            self._listener = logging.handlers.QueueListener(records, output)
+            self._listener.start()
+            handler = logging.handlers.QueueHandler(records)
+        else:
+            handler = output
+        handler.addFilter(SamplingFilter(sample_rate))
+        self.logger.addHandler(handler)
+        if capture_root:
+            root = logging.getLogger()
+            for existing in list(root.handlers):
+                root.removeHandler(existing)
+            root.addHandler(handler)
+        self.logger.setLevel(level.upper())
+        return self.logger
+
+    def after_fork(self):
+        """
+        Gives a forked child its own queue and listener thread. The listener
+        inherited from the parent is not running in the child, so without this
+        every record the child logs would stay on the queue forever.
+        """
+        # The inherited thread does not exist here; stopping it would block on a dead thread
+        self._listener = None
+        if self._options:
+            self.configure(**self._options)
+
+    def stop(self):
+        """Flush everything still queued; called automatically at exit."""
+        if self._listener is not None:
+            self._listener.stop()
+            self._listener = None
@@ -0,0 +1,135 @@
+import logging
+import math
+import threading
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+# Seconds; spans sub-millisecond preprocessing up to multi-second model calls
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Rows per model call
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 4096)
+
+
+def _format_value(value:float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram. observe() is one bisect and two additions under a
+    lock, so it costs well under a microsecond; cumulative bucket counts are
+    only built when the metrics are scraped.
+    """
+
+    def __init__(self, name:str, help:str, buckets:Iterable[float]):
+        self.name = name
+        self.help = help
+        self.upper_bounds:List[float] = sorted(buckets) + [math.inf]
+        self.counts = [0] * len(self.upper_bounds)
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value:float):
+        i = bisect_left(self.upper_bounds, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.sum += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            counts, total = list(self.counts), self.sum
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        cumulative = 0
+        for bound, count in zip(self.upper_bounds, counts):
+            cumulative += count
+            lines.append(f'{self.name}_bucket{{le="{_format_value(bound)}"}} {cumulative}')
+        lines.append(f"{self.name}_sum {total}")
+        lines.append(f"{self.name}_count {cumulative}")
+        return lines
+
+
+class Counter:
+    """Monotonic counter with an optional single label."""
+
+    def __init__(self, name:str, help:str, label:Optional[str]=None):
+        self.name = name
+        self.help = help
+        self.label = label
+        self.values:Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, label_value:str="", amount:int=1):
+        with self._lock:
+            self.values[label_value] = self.values.get(label_value, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = dict(self.values)
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        for label_value, value in sorted(values.items()):
+            labels = f'{{{self.label}="{label_value}"}}' if self.label else ""
+            lines.append(f"{self.name}{labels} {value}")
+        return lines
+
+
+class Gauge:
+    """Value that goes up and down, e.g. requests currently being served."""
+
+    def __init__(self, name:str, help:str):
+        self.name = name
+        self.help = help
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount:int=1):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount:int=1):
+        with self._lock:
+            self.value -= amount
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge", f"{self.name} {self.value}"]
+
+
+class ServingMetrics:
+    """
+    The prediction server's metrics, rendered in the Prometheus text exposition
+    format. Each process keeps its own counts, so under the pre-fork server a
+    scrape reflects whichever worker answered it.
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, prefix:str="house_price"):
+        self.request_seconds = Histogram(f"{prefix}_request_duration_seconds", "End-to-end /invocations latency.", LATENCY_BUCKETS)
+        self.preprocess_seconds = Histogram(f"{prefix}_preprocess_duration_seconds", "Time spent preprocessing a payload.", LATENCY_BUCKETS)
+        self.predict_seconds = Histogram(f"{prefix}_predict_duration_seconds", "Time spent in model.predict per call.", LATENCY_BUCKETS)
+        self.serialize_seconds = Histogram(f"{prefix}_serialize_duration_seconds", "Time spent encoding the response body.", LATENCY_BUCKETS)
+        self.batch_size = Histogram(f"{prefix}_batch_size_rows", "Rows per model call.", BATCH_SIZE_BUCKETS)
+        self.errors = Counter(f"{prefix}_errors_total", "Failed requests by error type.", label="type")
+        self.in_flight = Gauge(f"{prefix}_requests_in_flight", "Requests currently being served.")
+
+    def render(self, gauges:Optional[Dict[str, float]]=None, counters:Optional[Dict[str, float]]=None) -> str:
+        """
+        All metrics as exposition text. `gauges` adds point-in-time values owned
+        elsewhere and `counters` monotonic counts, exported with a `_total` suffix
+        so rate() and increase() work on them.
+        """
+        lines = []
+        for metric in (
+            self.request_seconds, self.preprocess_seconds, self.predict_seconds,
+            self.serialize_seconds, self.batch_size, self.errors, self.in_flight,
+        ):
+            lines.extend(metric.render())
+        for name, value in (gauges or {}).items():
+            lines.extend([f"# TYPE {name} gauge", f"{name} {value}"])
+        for name, value in (counters or {}).items():
+            name = name if name.endswith("_total") else f"{name}_total"
+            lines.extend([f"# TYPE {name} counter", f"{name} {value}"])
+        return "\n".join(lines) + "\n"
@@ -1,12 +1,15 @@
 import pandas as pd
+from typing import Optional
 from src.ingest_data import DataIngestorFactory
 from zenml import step
 
 @step
-def data_ingestion_step(file_path:str)->pd.DataFrame:
-    file_extension =".zip"
-
-    data_ingestor = DataIngestorFactory.get_data_ingestor(file_extension)
+def data_ingestion_step(
+    file_path:str, cache_dir:Optional[str]=".ingest_cache", schema_path:Optional[str]=None
+)->pd.DataFrame:
+    data_ingestor = DataIngestorFactory.get_data_ingestor_for_path(
+        file_path, cache_dir=cache_dir, schema_path=schema_path
+    )
     
     df = data_ingestor.ingest(file_path)
     return df
@@ -1,4 +1,5 @@
 import logging
+from typing import Optional
 from src.feature_engineering import LogTransformation,MinMaxScaling,StandardScaling, OneHotEncoding, FeatureEngineer
 import pandas as pd
 
@@ -6,7 +7,9 @@ from zenml import step
 
 
 @step
-def feature_engineer(df:pd.DataFrame, strategy:str="log",features:list=None) -> pd.DataFrame:
+def feature_engineer(
+    df:pd.DataFrame, strategy:str="log",features:list=None, state_path:Optional[str]=None
+) -> pd.DataFrame:
     
     if features is None:
         features = []
@@ -27,6 +30,10 @@ def feature_engineer(df:pd.DataFrame, strategy:str="log",features:list=None) ->
     
     transformed_df = engineer.apply_feature_engineering(df)
     
+    # Store the fitted transform next to the model so serving reuses it instead of refitting.
+    if state_path is not None:
+        engineer.save(state_path)
+    
     return transformed_df
         
         
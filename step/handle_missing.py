@@ -1,4 +1,5 @@
 import pandas as pd
+from typing import Optional
 from src.handle_missing_values import (
     DropMissingValuesStraṭegy,
     FillMissingValuesStrategy,
@@ -8,15 +9,20 @@ from src.handle_missing_values import (
 from zenml import step
 
 @step
-def handle_missing(df:pd.DataFrame, strategy:str='mean')->pd.DataFrame:
+def handle_missing(df:pd.DataFrame, strategy:str='mean', fill_values_path:Optional[str]=None)->pd.DataFrame:
     
     if strategy == "drop":
         handler = MissingValueHandler(DropMissingValuesStraṭegy(axis=0))
-    elif strategy in ["mean", "mode", "mode", "constant"]:
-        handler = MissingValueHandler(FillMissingValuesStrategy(method=strategy))
+    elif strategy in ["mean", "median", "mode", "constant"]:
+        fill_strategy = FillMissingValuesStrategy(method=strategy)
+        handler = MissingValueHandler(fill_strategy)
     else:
         raise ValueError(f"Unsupported missing value strategy:{strategy}")
     
     cleaned_df = handler.execute_strategy(df)
+    
+    # Keep the training-time fill values so the serving side can reuse them.
+    if fill_values_path is not None and strategy != "drop":
+        fill_strategy.save(fill_values_path)
     return cleaned_df
-            
\ No newline at end of file
+            
@@ -1,6 +1,6 @@
 import logging
 
-from typing import Annotated
+from typing import Annotated, Optional
 import mlflow
 import pandas as pd
 
@@ -13,6 +13,7 @@ from sklearn.preprocessing import OneHotEncoder
 from zenml import ArtifactConfig, step
 from zenml.client import Client
 from sklearn.linear_model import ElasticNet
+from src.feature_schema import FeatureSchema
 
 
 logging.basicConfig(level=logging.INFO)
@@ -31,7 +32,7 @@ model = Model(
 )
 
 @step(enable_cache=False, experiment_tracker=experiment_tracker.name, model=model)
-def model_buildd( X_train:pd.DataFrame, y_train:pd.Series)->Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
+def model_buildd( X_train:pd.DataFrame, y_train:pd.Series, sparse_onehot:bool=True, feature_schema_path:Optional[str]=None)->Annotated[Pipeline, ArtifactConfig(name="sklearn_pipeline", is_model_artifact=True)]:
         if not isinstance(X_train, pd.DataFrame):
             raise TypeError("X_train must be a pandas DataFrame.")
         if not isinstance(y_train, pd.Series):
@@ -48,15 +49,18 @@ def model_buildd( X_train:pd.DataFrame, y_train:pd.Series)->Annotated[Pipeline,
         categorical_transformer = Pipeline(
             steps=[
                 ("imputer", SimpleImputer(strategy="most_frequent")),
-                ("Onehot", OneHotEncoder(handle_unknown = "ignore")),
+                ("Onehot", OneHotEncoder(handle_unknown = "ignore", sparse_output = sparse_onehot)),
             ]
         )
         
+        # sparse_threshold=1.0 keeps the stacked matrix sparse whenever the one-hot
+        # block is sparse, so wide encodings never get densified before ElasticNet.
         preprocessor = ColumnTransformer(
             transformers =[
                 ("num", numerical_transformer, numerical_cols),
                 ("cat", categorical_transformer, categorical_cols),
-            ]
+            ],
+            sparse_threshold = 1.0 if sparse_onehot else 0.0,
         )
         
         '''pipeline = Pipeline(steps=[("preprocessor", preprocessor),("model", LinearRegression())])'''
@@ -70,14 +74,14 @@ def model_buildd( X_train:pd.DataFrame, y_train:pd.Series)->Annotated[Pipeline,
             pipeline.fit(X_train, y_train)
             logging.info("Model training completed")
             
-            onehot_encoder = (
-                pipeline.named_steps["preprocessor"].transformers_[1][1].named_steps["Onehot"]
-            )
-            
-            onehot_encoder.fit(X_train[categorical_cols])
-            expected_columns = numerical_cols.tolist() + list(onehot_encoder.get_feature_names_out(categorical_cols))
+            # Read the columns off the fitted transformers; refitting the encoder here
+            # would cost another pass over the data and mutate the fitted pipeline.
+            feature_schema = FeatureSchema.from_pipeline(pipeline)
+            logging.info(f"Models Expects the following columns:{feature_schema.output_columns}")
             
-            logging.info(f"Models Expects the following columns:{expected_columns}")
+            mlflow.log_dict(feature_schema.to_dict(), "feature_schema.json")
+            if feature_schema_path is not None:
+                feature_schema.save(feature_schema_path)
             
         except Exception as e:
             logging.error(f"Error during model training:{e}")
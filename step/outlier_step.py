@@ -24,10 +24,9 @@ def outlier_detection_step(df:pd.DataFrame, column_name:str):
     if column_name not in df.columns:
         logging.error(f"Column '{column_name}' does not exist in DataFrame")
         raise ValueError(f"Column '{column_name}' does not exist in DataFrame")
-    df_numeric = df.select_dtypes(include = [int, float])
+    df_numeric = df.select_dtypes(include = ["number"])
     
     outlier_detector = OutlierDetectorr(strategy=ZSCoreOutlierDetection(threshold=3))
-    outliers = outlier_detector.detect_outliers(df_numeric)
     df_cleaned = outlier_detector.handle_outliers(df_numeric, method="remove")
     
     return df_cleaned
\ No newline at end of file
@@ -0,0 +1,31 @@
+import struct
+
+import pandas as pd
+import pytest
+
+from src.binary_payloads import ARROW_STREAM, FLOAT64_MATRIX, PayloadError, decode_frame, encode_frame
+
+
+def test_float64_matrix_round_trip():
+    df = pd.DataFrame({"Lot Area": [9600.0, 11250.0], "Gr Liv Area": [1710.0, 0.0]})
+    pd.testing.assert_frame_equal(decode_frame(FLOAT64_MATRIX, encode_frame(FLOAT64_MATRIX, df)), df)
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        b"\x01",
+        struct.pack("<I", 100) + b"[]",
+        struct.pack("<I", 3) + b"\xff\xfe\x00",
+        struct.pack("<I", 2) + b"{}",
+        encode_frame(FLOAT64_MATRIX, pd.DataFrame({"a": [1.0, 2.0]}))[:-3],
+    ],
+)
+def test_malformed_float64_matrix_raises_payload_error(body):
+    with pytest.raises(PayloadError):
+        decode_frame(FLOAT64_MATRIX, body)
+
+
+def test_malformed_arrow_stream_raises_payload_error():
+    with pytest.raises(PayloadError):
+        decode_frame(ARROW_STREAM, b"garbage")
@@ -0,0 +1,18 @@
+import numpy as np
+import pandas as pd
+
+from src.feature_engineering import OneHotEncoding
+
+
+def test_sparse_onehot_round_trips_zeros():
+    df = pd.DataFrame({"Street": ["Pave", "Grvl", "Pave", "Pave"], "Lot Area": [9600, 11250, 0, 8450]})
+    encoder = OneHotEncoding(features=["Street"], sparse=True).fit(df)
+    sparse = encoder.transform(df)
+    dense = OneHotEncoding(features=["Street"], sparse=False).fit(df).transform(df)
+
+    column = encoder.encoder.get_feature_names_out(["Street"])[0]
+    assert sparse[column].dtype == pd.SparseDtype(float, 0)
+    # Zeros are the fill value, so they are implicit rather than stored
+    assert sparse[column].sparse.npoints == int((dense[column] != 0).sum())
+    np.testing.assert_array_equal(sparse[column].sparse.to_dense().to_numpy(), dense[column].to_numpy())
+    assert (sparse["Lot Area"] == df["Lot Area"]).all()
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+
+from src.prediction_cache import PredictionCache
+
+
+class CountingModel:
+    """Predicts a fixed linear function and records how many rows it scored per call."""
+
+    def __init__(self, scale:float=2.0):
+        self.scale = scale
+        self.calls = []
+
+    def predict(self, df:pd.DataFrame) -> np.ndarray:
+        self.calls.append(len(df))
+        return df["a"].to_numpy() * self.scale + df["b"].to_numpy()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def frame(values):
+    return pd.DataFrame({"a": [float(v) for v in values], "b": [1.0] * len(values)})
+
+
+def test_hit_then_expiry():
+    clock = FakeClock()
+    cache = PredictionCache(max_entries=10, ttl_seconds=10, clock=clock)
+    model = CountingModel()
+    df = frame([1, 2])
+
+    cache.predict(model, df)
+    clock.now = 9.0
+    cache.predict(model, df)
+    assert model.calls == [2]
+
+    clock.now = 10.0
+    np.testing.assert_array_equal(cache.predict(model, df), CountingModel().predict(df))
+    metrics = cache.metrics()
+    assert model.calls == [2, 2]
+    assert (metrics["hits"], metrics["misses"], metrics["expirations"]) == (2, 4, 2)
+
+
+def test_evicts_least_recently_used():
+    cache = PredictionCache(max_entries=2, clock=FakeClock())
+    model = CountingModel()
+    cache.predict(model, frame([1]))
+    cache.predict(model, frame([2]))
+    # Touch 1 so 2 becomes the least recently used
+    cache.predict(model, frame([1]))
+    cache.predict(model, frame([3]))
+    assert cache.metrics()["evictions"] == 1
+
+    model.calls.clear()
+    cache.predict(model, frame([1]))
+    cache.predict(model, frame([3]))
+    assert model.calls == []
+    cache.predict(model, frame([2]))
+    assert model.calls == [1]
+
+
+def test_mixed_batch_matches_model():
+    cache = PredictionCache(max_entries=100, clock=FakeClock())
+    model = CountingModel()
+    cache.predict(model, frame([1, 3, 5]))
+
+    df = frame([0, 1, 2, 3, 4, 5, 2])
+    predictions = cache.predict(model, df)
+    np.testing.assert_array_equal(predictions, CountingModel().predict(df))
+    # Only the four uncached rows reach the model, duplicates included
+    assert model.calls == [3, 4]
+
+
+def test_model_change_invalidates():
+    cache = PredictionCache(max_entries=100, clock=FakeClock())
+    first, second = CountingModel(scale=2.0), CountingModel(scale=3.0)
+    df = frame([1, 2])
+    cache.predict(first, df)
+
+    np.testing.assert_array_equal(cache.predict(second, df), CountingModel(scale=3.0).predict(df))
+    assert second.calls == [2]
+    assert cache.metrics()["invalidations"] == 1
+
+
+def test_on_model_call_reports_rows_sent():
+    sizes = []
+    cache = PredictionCache(max_entries=100, clock=FakeClock(), on_model_call=sizes.append)
+    model = CountingModel()
+    cache.predict(model, frame([1, 2]))
+    cache.predict(model, frame([1, 2, 3]))
+    assert sizes == [2, 1]